@@ -10,6 +10,7 @@
 # :copyright: (c) 2016-2020 by Nicholas Repole and contributors.
 #             See AUTHORS for more details.
 # :license: MIT - See LICENSE for more details.
+import collections
 import collections.abc
 from contextlib import suppress
 from marshmallow.fields import Field, Nested, missing_
@@ -24,7 +25,8 @@ from drowsy.exc import (
     PermissionDeniedError, ResourceNotFoundError, MISSING_ERROR_MESSAGE)
 from drowsy.log import Loggable
 from drowsy.permissions import AllowAllOpPermissions
-from drowsy.utils import get_error_message, get_field_by_data_key
+from drowsy.utils import (
+    MemoizingDict, get_error_message, get_field_by_data_key)
 
 
 class EmbeddableMixinABC(Field):
@@ -565,6 +567,8 @@ class ResourceABC(Loggable):
 
     """Abstract resource base class."""
 
+    __slots__ = ()
+
     @property
     def options(self):
         """Get the available options for this resource.
@@ -681,6 +685,8 @@ class SchemaResourceABC(ResourceABC):
 
     """Abstract schema based resource class."""
 
+    __slots__ = ()
+
     @property
     def schema(self):
         """The schema for this resource.
@@ -741,6 +747,8 @@ class NestableResourceABC(ResourceABC):
 
     """Abstract nestable resource class."""
 
+    __slots__ = ()
+
     def make_subresource(self, name):
         """Given a subresource name, construct a subresource.
 
@@ -756,6 +764,11 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
 
     """Base Schema Resource abstract class to inherit from."""
 
+    __slots__ = ("_page_max_size", "_page_max_size_is_callable",
+                 "parent_field", "_context", "_context_is_callable",
+                 "_schema", "_key_name_cache", "_whitelist_cache",
+                 "_lookup_schema", "_lookup_context", "error_messages")
+
     _default_error_messages = {
         "validation_failure": "Unable to process entity.",
         "invalid_embed": "Invalid embed supplied: %(embed)s",
@@ -794,6 +807,18 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         "unexpected_error": "An unexpected error has occurred."
     }
 
+    # Maps error keys to the exception class raised for them, and
+    # whether that class accepts an ``errors`` argument. Any key not
+    # found here results in a ``BadRequestError``.
+    _error_classes = {
+        "validation_failure": (UnprocessableEntityError, True),
+        "commit_failure": (UnprocessableEntityError, True),
+        "invalid_collection_input": (UnprocessableEntityError, True),
+        "resource_not_found": (ResourceNotFoundError, False),
+        "method_not_allowed": (MethodNotAllowedError, False),
+        "permission_denied": (PermissionDeniedError, True)
+    }
+
     class Meta(object):
         """Options object for a Resource.
 
@@ -842,20 +867,43 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :type parent_field: Field
 
         """
-        self._page_max_size = page_max_size
         self.parent_field = parent_field
-        if self._page_max_size is None and hasattr(self.opts, "page_max_size"):
-            self._page_max_size = self.opts.page_max_size
-        self._context = context
+        if page_max_size is None and hasattr(self.opts, "page_max_size"):
+            page_max_size = self.opts.page_max_size
+        # Resolve how page_max_size and context are to be accessed now,
+        # rather than checking on every property access.
+        self._page_max_size_is_callable = callable(page_max_size)
+        if not self._page_max_size_is_callable and page_max_size == 0:
+            page_max_size = None
+        self._page_max_size = page_max_size
+        self.context = context
         self._schema = None
-        # Set up error messages
-        messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, '_default_error_messages', {}))
+        # Set up error messages, layered over the class defaults
+        # without copying them.
+        maps = [dict(error_messages or {})]
         if isinstance(self.opts.error_messages, dict):
-            messages.update(self.opts.error_messages)
-        messages.update(error_messages or {})
-        self.error_messages = messages
+            maps.append(self.opts.error_messages)
+        maps.append(self._get_class_error_messages())
+        self.error_messages = collections.ChainMap(*maps)
+
+    @classmethod
+    def _get_class_error_messages(cls):
+        """Get the default error messages merged across the class MRO.
+
+        The merged result is computed once and stored on each class.
+
+        :return: Default error messages for this class, with those of
+            subclasses taking precedence over their parents.
+        :rtype: dict
+
+        """
+        messages = cls.__dict__.get("_merged_default_error_messages")
+        if messages is None:
+            messages = {}
+            for klass in reversed(cls.__mro__):
+                messages.update(getattr(klass, "_default_error_messages", {}))
+            cls._merged_default_error_messages = messages
+        return messages
 
     @property
     def schema(self):
@@ -914,44 +962,44 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
             self._get_embed_info(embeds=embeds_subfilters, strict=strict))
         # fields
         converted_fields = []
+        seen_fields = set()
         if fields:
+            convert_key_name = self.get_key_name_converter()
             for field in fields:
-                converted_field = self.convert_key_name(field)
+                converted_field = convert_key_name(field)
                 if converted_field is None:
                     if strict:
                         raise self.make_error("invalid_field", field=field)
-                elif converted_field:
+                elif converted_field and converted_field not in seen_fields:
+                    seen_fields.add(converted_field)
                     converted_fields.append(converted_field)
         if converted_fields:
             for embed_field in converted_embeds:
                 embed = embed_field.split(".")[0]
-                if embed not in converted_fields:
+                if embed not in seen_fields:
+                    seen_fields.add(embed)
                     converted_fields.append(embed)
-            kwargs = self._get_schema_kwargs(self.schema_cls)
-            kwargs.update(
-                only=tuple(converted_fields),
-                partial=partial,
-                instance=instance
-            )
-            schema = self.schema_cls(**kwargs)
-        else:
-            kwargs = self._get_schema_kwargs(self.schema_cls)
-            kwargs.update(
-                partial=partial,
-                instance=instance
-            )
-            schema = self.schema_cls(**kwargs)
+        kwargs = self._get_schema_kwargs(self.schema_cls)
+        kwargs["partial"] = partial
+        kwargs["instance"] = instance
+        if converted_fields:
+            kwargs["only"] = tuple(converted_fields)
+        schema = self.schema_cls(**kwargs)
         # actually attempt to embed now
-        for converted_embed in converted_embeds:
-            try:
-                schema.embed([converted_embed])
-            except AttributeError:  # pragma: no cover
-                # _get_embed_info should catch this
-                # keeping here as a safeguard
-                if strict:
-                    raise self.make_error(
-                        "invalid_embed",
-                        embed=embed_name_mapping[converted_embed])
+        try:
+            schema.embed(converted_embeds)
+        except AttributeError:  # pragma: no cover
+            # _get_embed_info should catch this
+            # keeping here as a safeguard
+            # Embed one at a time to find the invalid embed.
+            for converted_embed in converted_embeds:
+                try:
+                    schema.embed([converted_embed])
+                except AttributeError:
+                    if strict:
+                        raise self.make_error(
+                            "invalid_embed",
+                            embed=embed_name_mapping[converted_embed])
         self._schema = schema
         return schema
 
@@ -963,9 +1011,8 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :returns: A constructed :class:`~drowsy.resource.Resource`
 
         """
-        # NOTE: No risk of BadRequestError here due to no embeds or
-        # fields being passed to make_schema
-        field = get_field_by_data_key(self.schema, data_key=name)
+        field = get_field_by_data_key(
+            self._get_lookup_schema(), data_key=name)
         if isinstance(field, NestedPermissibleABC):
             return field.resource
         raise ValueError("The provided name is not a valid subresource.")
@@ -987,36 +1034,19 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
             `BadRequestError` is returned.
 
         """
-        unproccessable_errors = {"validation_failure", "commit_failure",
-                                 "invalid_collection_input"}
-        if key in unproccessable_errors:
-            return UnprocessableEntityError(
-                code=key,
-                message=self._get_error_message(key, **kwargs),
-                errors=errors or {},
-                **kwargs)
-        elif key == "resource_not_found":
-            return ResourceNotFoundError(
-                code=key,
-                message=self._get_error_message(key, **kwargs),
-                **kwargs
-            )
-        elif key == "method_not_allowed":
-            return MethodNotAllowedError(
-                code=key,
-                message=self._get_error_message(key, **kwargs),
-                **kwargs)
-        elif key == "permission_denied":
-            return PermissionDeniedError(
+        message = self._get_error_message(key, **kwargs)
+        error_cls, takes_errors = self._error_classes.get(
+            key, (BadRequestError, False))
+        if takes_errors:
+            return error_cls(
                 code=key,
+                message=message,
                 errors=errors or {},
-                message=self._get_error_message(key, **kwargs),
-                **kwargs)
-        else:
-            return BadRequestError(
-                code=key,
-                message=self._get_error_message(key, **kwargs),
                 **kwargs)
+        return error_cls(
+            code=key,
+            message=message,
+            **kwargs)
 
     def _get_error_message(self, key, **kwargs):
         """Get an error message based on a key name.
@@ -1042,7 +1072,7 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
             return get_error_message(
                 error_messages=self.error_messages,
                 key=key,
-                gettext=self.context.get("gettext", None),
+                gettext=self._get_gettext(),
                 **kwargs)
         except KeyError:
             class_name = self.__class__.__name__
@@ -1058,6 +1088,28 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         """
         return self.opts.schema_cls
 
+    def _get_lookup_schema(self):
+        """Get a schema instance used only to look up field info.
+
+        Used by :meth:`whitelist` and :meth:`convert_key_name`, which
+        only read field names and attributes, so a single instance is
+        reused until the context changes or
+        :meth:`_reset_lookup_caches` is called. A new instance is
+        created for each call if :meth:`_can_cache_lookups` is
+        ``False``.
+
+        :return: An instance of this resource's schema class.
+        :rtype: :class:`~drowsy.schema.ResourceSchema`
+
+        """
+        if not self._can_cache_lookups():
+            return self.schema_cls(**self._get_schema_kwargs(self.schema_cls))
+        self._check_lookup_context()
+        if self._lookup_schema is None:
+            self._lookup_schema = self.schema_cls(
+                **self._get_schema_kwargs(self.schema_cls))
+        return self._lookup_schema
+
     def whitelist(self, key):
         """Determine whether a field is valid to be queried.
 
@@ -1065,12 +1117,31 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         to determine whether the field should be queryable. Also handles
         nested queries with the same logic.
 
+        Results are cached until the context changes or
+        :meth:`_reset_lookup_caches` is called, unless
+        :meth:`_can_cache_lookups` is ``False``.
+
         :param str key: Dot notation field name. For example, if trying
             to query an album, this may look something like
             ``"tracks.playlists.track_id"``.
 
         """
-        schema = self.schema_cls(**self._get_schema_kwargs(self.schema_cls))
+        if not self._can_cache_lookups():
+            return self._check_whitelist(key)
+        self._check_lookup_context()
+        if self._whitelist_cache is None:
+            self._whitelist_cache = MemoizingDict(self._check_whitelist)
+        return self._whitelist_cache[key]
+
+    def _check_whitelist(self, key):
+        """Uncached implementation of :meth:`whitelist`.
+
+        :param str key: Dot notation field name.
+        :return: ``True`` if the field may be queried.
+        :rtype: bool
+
+        """
+        schema = self._get_lookup_schema()
         split_keys = key.split(".")
         if len(split_keys) == 1 and split_keys[0] == "":
             return True
@@ -1082,8 +1153,6 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
                     return False
                 elif not split_keys:
                     return True
-                elif isinstance(field, EmbeddableMixinABC):
-                    schema.embed([key])
                 if isinstance(field, Nested):
                     if isinstance(field, NestedPermissibleABC):
                         with suppress(ValueError, TypeError):
@@ -1097,6 +1166,29 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
                 return False
         return True  # pragma no cover
 
+    def get_key_name_converter(self):
+        """Get a memoized key name converting function.
+
+        Results of :meth:`convert_key_name` are cached until the context
+        changes or :meth:`_reset_lookup_caches` is called. When :meth:`_can_cache_lookups` is ``False``,
+        :meth:`convert_key_name` itself is returned instead.
+
+        Preferable to calling :meth:`convert_key_name` directly when it
+        will be called repeatedly. Overrides of
+        :meth:`convert_key_name` are still used.
+
+        :return: A callable that takes a dumped key name and returns
+            the same result as :meth:`convert_key_name`.
+        :rtype: callable
+
+        """
+        if not self._can_cache_lookups():
+            return self.convert_key_name
+        self._check_lookup_context()
+        if self._key_name_cache is None:
+            self._key_name_cache = MemoizingDict(self.convert_key_name)
+        return self._key_name_cache.__getitem__
+
     def convert_key_name(self, key):
         """Given a dumped key name, convert to the name of the field.
 
@@ -1108,7 +1200,7 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :rtype: str or None
 
         """
-        schema = self.schema_cls(**self._get_schema_kwargs(self.schema_cls))
+        schema = self._get_lookup_schema()
         split_keys = key.split(".")
         result_keys = []
         while split_keys:
@@ -1118,8 +1210,6 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
                 result_keys.append(field.name)
                 if not split_keys:
                     return ".".join(result_keys)
-                if isinstance(field, EmbeddableMixinABC):
-                    schema.embed([field.name])
                 if isinstance(field, Nested):
                     if isinstance(field, NestedPermissibleABC):
                         with suppress(ValueError, TypeError):
@@ -1149,13 +1239,9 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :rtype: int or None
 
         """
-        if callable(self._page_max_size):
+        if self._page_max_size_is_callable:
             return self._page_max_size(self)
-        elif self._page_max_size is not None:
-            if self._page_max_size == 0:
-                return None
-            else:
-                return self._page_max_size
+        return self._page_max_size
 
     @property
     def context(self):
@@ -1166,12 +1252,9 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :rtype: dict
 
         """
-        if callable(self._context):
+        if self._context_is_callable:
             return self._context()
-        else:
-            if self._context is None:
-                self._context = {}
-            return self._context
+        return self._context
 
     @context.setter
     def context(self, val):
@@ -1181,7 +1264,63 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         :type val: dict, callable, or None
 
         """
-        self._context = val
+        self._context_is_callable = callable(val)
+        self._context = {} if val is None else val
+        self._reset_lookup_caches()
+
+    def _can_cache_lookups(self):
+        """Check whether field lookups may be cached on this resource.
+
+        The lookup schema, whitelist results, and converted key names
+        all depend on the context, so they can't be cached when the
+        context is a callable that may change between calls.
+
+        :return: ``True`` if lookups may be cached.
+        :rtype: bool
+
+        """
+        return not self._context_is_callable
+
+    def _check_lookup_context(self):
+        """Clear cached lookups if the context was updated in place.
+
+        The context dict may be changed without being reassigned, e.g.
+        by a nested field passing along its parent's context, so its
+        contents are compared with a shallow copy taken when the caches
+        were last cleared. Changes made inside a context value, rather
+        than to the dict itself, aren't detected.
+
+        :return: ``None``
+
+        """
+        if self._lookup_context != self._context:
+            self._reset_lookup_caches()
+            self._lookup_context = dict(self._context)
+
+    def _reset_lookup_caches(self):
+        """Clear the cached lookup schema, whitelist, and key names.
+
+        :return: ``None``
+
+        """
+        self._key_name_cache = None
+        self._whitelist_cache = None
+        self._lookup_schema = None
+        self._lookup_context = None
+
+    def _get_gettext(self):
+        """Get the ``"gettext"`` callable from the context, if any.
+
+        Not cached, as the context dict may be updated in place, e.g.
+        by a nested field passing along its parent's context.
+
+        :return: The translation callable set in the context.
+        :rtype: callable or None
+
+        """
+        if self._context_is_callable:
+            return self._context().get("gettext", None)
+        return self._context.get("gettext", None)
 
     def _get_schema_kwargs(self, schema_cls):
         """Get default kwargs for any new schema creation.
@@ -1222,8 +1361,9 @@ class BaseResourceABC(SchemaResourceABC, NestableResourceABC):
         embed_fields = set()
         if embeds is None:
             embeds = []
+        convert_key_name = self.get_key_name_converter()
         for embed in embeds:
-            converted_embed = self.convert_key_name(embed)
+            converted_embed = convert_key_name(embed)
             embed_name_mapping[converted_embed] = embed
             if converted_embed is None:
                 if strict:
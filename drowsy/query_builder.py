@@ -16,7 +16,7 @@ from drowsy.parser import SortInfo, SubfilterInfo
 from drowsy.utils import get_field_by_data_key
 from sqlalchemy import and_, func, or_
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import aliased, contains_eager
+from sqlalchemy.orm import aliased, contains_eager, selectinload
 from sqlalchemy.orm.interfaces import MANYTOMANY, ONETOMANY
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 from mqlalchemy import (
@@ -101,8 +101,8 @@ class QueryBuilder(Loggable):
             record_class = query.column_descriptions[0]["expr"]
             order_bys = self._get_order_bys(
                 record_class, sorts, convert_key_names_func)
-            for order_by in order_bys:
-                query = query.order_by(order_by)
+            if order_bys:
+                query = query.order_by(*order_bys)
         else:
             raise ValueError
         return query
@@ -265,7 +265,8 @@ class ModelResourceQueryBuilder(QueryBuilder):
 
     def build(self, query, resource, filters, subfilters, embeds=None,
               offset=None, limit=None, sorts=None, strict=True,
-              stack_size_limit=100, dialect_override=None):
+              stack_size_limit=100, dialect_override=None,
+              embed_strategy="joined", filters_applied=False):
         """Build a complex query using user supplied parameters.
 
         :param query: A SQLAlchemy query.
@@ -297,6 +298,14 @@ class ModelResourceQueryBuilder(QueryBuilder):
             with row_number support regardless of any db limitations.
             If ``False``, will avoid using row_number even if the
             database supports it. Mainly used for testing.
+        :param str embed_strategy: ``"joined"`` to load embeds using
+            joined subqueries, or ``"selectin"`` to load them using
+            a separate ``SELECT ... IN`` query per relationship when
+            possible. See :meth:`_get_selectin_options`.
+        :param bool filters_applied: ``True`` if ``query`` has already
+            had filters applied to it via
+            :meth:`apply_resource_filters`, in which case ``filters``
+            is ignored.
         :return: query with joins, load options, and subresource
             filters applied as appropriate.
         :raise BadRequestError: Uses the provided resource to raise
@@ -308,22 +317,19 @@ class ModelResourceQueryBuilder(QueryBuilder):
 
         """
         # apply filters
-        try:
-            query = self.apply_filters(
-                query,
-                resource.model,
+        if not filters_applied:
+            query = self.apply_resource_filters(
+                query=query,
+                resource=resource,
                 filters=filters,
-                nested_conditions=resource.get_required_nested_filters,
-                whitelist=resource.whitelist,
-                stack_size_limit=stack_size_limit,
-                convert_key_names_func=resource.convert_key_name,
-                gettext=resource.context.get("gettext", None))
-        except InvalidMqlException as exc:
-            self._handle_filter_errors(
+                stack_size_limit=stack_size_limit)
+        selectin_options = None
+        if embeds and not subfilters and embed_strategy == "selectin":
+            selectin_options = self._get_selectin_options(
                 resource=resource,
-                exc=exc)
-        query = resource.apply_required_filters(query)
-        if subfilters or embeds:
+                embeds=embeds,
+                dialect_override=dialect_override)
+        if (subfilters or embeds) and selectin_options is None:
             # more complex process.
             # don't apply offset/limit/sorts here
             # will need to be taken care of by apply_subquery_loads
@@ -341,35 +347,146 @@ class ModelResourceQueryBuilder(QueryBuilder):
         else:
             # simple query, apply offset/limit/sorts now
             if not sorts and offset is not None:
-                sorts = []
-                for key in resource.schema.id_keys:
-                    attr = resource.schema.fields.get(key).data_key or key
-                    sorts.append(SortInfo(attr=attr))
+                sorts = [
+                    SortInfo(attr=name)
+                    for name in resource._get_id_filter_names()]
             if sorts:
-                for sort in sorts:
-                    if not isinstance(sort, SortInfo):
-                        raise TypeError("Each sort must be of type SortInfo.")
-                    try:
-                        query = self.apply_sorts(
-                            query, [sort], resource.convert_key_name)
-                    except AttributeError:
-                        if strict:
-                            raise resource.make_error(
-                                "invalid_sort_field", field=sort.attr)
-            try:
-                query = self.apply_offset(query, offset)
-            except ValueError:
-                if strict:
+                if not all(isinstance(sort, SortInfo) for sort in sorts):
+                    raise TypeError("Each sort must be of type SortInfo.")
+                convert_key_name = resource.get_key_name_converter()
+                try:
+                    query = self.apply_sorts(query, sorts, convert_key_name)
+                except AttributeError:
+                    # At least one sort is invalid. Apply them one at a
+                    # time to either report or skip the invalid ones.
+                    for sort in sorts:
+                        try:
+                            query = self.apply_sorts(
+                                query, [sort], convert_key_name)
+                        except AttributeError:
+                            if strict:
+                                raise resource.make_error(
+                                    "invalid_sort_field", field=sort.attr)
+            # Validate offset and limit inline rather than going through
+            # apply_offset and apply_limit, as this runs for every
+            # collection request. Values are coerced the same way.
+            if offset is not None:
+                try:
+                    int_offset = int(offset)
+                except ValueError:
+                    int_offset = -1
+                if int_offset >= 0:
+                    query = query.offset(int_offset)
+                elif strict:
                     raise resource.make_error(
                         "invalid_offset_value", offset=offset)
-            try:
-                query = self.apply_limit(query, limit)
-            except ValueError:
-                if strict:
+            if limit is not None:
+                try:
+                    int_limit = int(limit)
+                except ValueError:
+                    int_limit = -1
+                if int_limit >= 0:
+                    query = query.limit(int_limit)
+                elif strict:
                     raise resource.make_error(
                         "invalid_limit_value", limit=limit)
+            if selectin_options:
+                query = query.options(*selectin_options)
         return query
 
+    def apply_resource_filters(self, query, resource, filters,
+                               stack_size_limit=100):
+        """Apply user supplied and required filters for a resource.
+
+        :param query: A SQLAlchemy query.
+        :param resource: Resource the filters are being applied for.
+        :type resource: :class:`~drowsy.resource.BaseModelResource`
+        :param filters: The MQLAlchemy style filters to apply.
+        :type filters: dict or None
+        :param stack_size_limit: Used to limit the allowable complexity
+            of the applied filters.
+        :type stack_size_limit: int or None
+        :return: The query with filters applied.
+        :raise BadRequestError: Uses the provided resource to raise
+            an error when the filters are unable to be applied.
+
+        """
+        if filters:
+            try:
+                query = self.apply_filters(
+                    query,
+                    resource.model,
+                    filters=filters,
+                    nested_conditions=resource.get_required_nested_filters,
+                    whitelist=resource.whitelist,
+                    stack_size_limit=stack_size_limit,
+                    convert_key_names_func=resource.get_key_name_converter(),
+                    gettext=resource._get_gettext())
+            except InvalidMqlException as exc:
+                self._handle_filter_errors(
+                    resource=resource,
+                    exc=exc)
+        return resource.apply_required_filters(query)
+
+    def _get_selectin_options(self, resource, embeds, dialect_override=None):
+        """Get selectin load options for the provided embeds if possible.
+
+        Loading an embedded relationship using a separate
+        ``SELECT ... IN`` query avoids the row explosion of joining
+        it in, but gives no way to apply required filters or a default
+        limit to the embedded subresource. As such, ``None`` is
+        returned if any subresource along an embed's path has required
+        filters, has a default limit that would otherwise be applied,
+        or if an embed is invalid.
+
+        :param resource: Base resource the embeds are relative to.
+        :type resource: :class:`~drowsy.resource.BaseModelResource`
+        :param embeds: List of subresources and fields to embed.
+        :type embeds: list
+        :param bool|None dialect_override: See :meth:`build`.
+        :return: A list of load options, or ``None`` if the embeds
+            must be loaded using :meth:`apply_subquery_loads`.
+        :rtype: list or None
+
+        """
+        dialect_supported = self.row_number_supported(
+            dialect=resource.session.bind.name,
+            dialect_override=dialect_override)
+        options = []
+        for embed in embeds:
+            subresource = resource
+            schema = subresource._get_lookup_schema()
+            option = None
+            split_keys = embed.split(".")
+            while split_keys:
+                split_key = split_keys.pop(0)
+                field = get_field_by_data_key(
+                    schema=schema,
+                    data_key=split_key)
+                if not isinstance(field, NestedRelated):
+                    if field is None or split_keys:
+                        return None
+                    # embed ending in a non relationship attribute
+                    break
+                attr = getattr(subresource.model, field.name)
+                try:
+                    subresource = subresource.make_subresource(
+                        name=split_key)
+                except ValueError:  # pragma: no cover
+                    return None
+                if subresource.get_required_filters() is not None:
+                    return None
+                if dialect_supported and subresource.page_max_size:
+                    return None
+                if option is None:
+                    option = selectinload(attr)
+                else:
+                    option = option.selectinload(attr)
+                schema = subresource._get_lookup_schema()
+            if option is not None:
+                options.append(option)
+        return options
+
     def _get_many_to_many_join(self, child, parent, relationship,
                                assoc_queryable):
         parent_expressions = []
@@ -637,18 +754,24 @@ class ModelResourceQueryBuilder(QueryBuilder):
 
         """
         record_class = resource.model
-        schema = resource.make_schema()
+        schema = resource._get_lookup_schema()
         id_keys = schema.id_keys
         if sorts:
-            order_bys = []
-            for sort in sorts:
-                try:
-                    order_bys = self._get_order_bys(
-                        record_class, [sort], resource.convert_key_name)
-                except AttributeError:
-                    if strict:
-                        raise resource.make_error(
-                            "invalid_sort_field", field=sort.attr)
+            convert_key_name = resource.get_key_name_converter()
+            try:
+                order_bys = self._get_order_bys(
+                    record_class, sorts, convert_key_name)
+            except AttributeError:
+                # Retry one at a time to find the invalid sort.
+                order_bys = []
+                for sort in sorts:
+                    try:
+                        order_bys.extend(self._get_order_bys(
+                            record_class, [sort], convert_key_name))
+                    except AttributeError:
+                        if strict:
+                            raise resource.make_error(
+                                "invalid_sort_field", field=sort.attr)
         else:
             order_bys = []
             for attr_name in id_keys:
@@ -797,7 +920,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
         subquery_tracker = {}
         for subfilter_key in subfilter_keys:
             resource = root_resource
-            schema = resource.make_schema()
+            schema = resource._get_lookup_schema()
             split_subfilter_keys = subfilter_key.split(".")
             last_node = root
             subfilter_info = subfilters.get(subfilter_key)
@@ -824,7 +947,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                     data_key=split_key)
                 if isinstance(field, NestedRelated):
                     resource = resource.make_subresource(name=split_key)
-                    schema = resource.make_schema()
+                    schema = resource._get_lookup_schema()
                     for node in last_node.children:
                         if node.name == field.name:
                             # node already exists in last_node children
@@ -866,7 +989,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                             offset=user_supplied_offset,
                             sorts=user_supplied_sorts,
                             children=[],
-                            convert_key_name=resource.convert_key_name,
+                            convert_key_name=resource.get_key_name_converter(),
                             whitelist=resource.whitelist,
                             relationship_direction=relationship_direction
                         )
@@ -883,7 +1006,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                                 raise root_resource.make_error(
                                     "invalid_subresource_limit",
                                     supplied_limit=user_supplied_limit,
-                                    max_limit=resource.page_max_size,
+                                    max_limit=default_limit,
                                     subresource_key=subfilter_key)
                             user_supplied_limit = default_limit
                         elif user_supplied_limit is not None:
@@ -962,7 +1085,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                                     order_by = self._get_order_bys(
                                         last_node.alias,
                                         last_node.sorts,
-                                        resource.convert_key_name
+                                        resource.get_key_name_converter()
                                     )
                                 else:
                                     # Otherwise use pk(s)/schema ids
@@ -1007,7 +1130,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                                         nested_conditions=nested_conditions,
                                         filters=user_supplied_filters,
                                         convert_key_names_func=(
-                                            resource.convert_key_name),
+                                            resource.get_key_name_converter()),
                                         stack_size_limit=stack_size_limit
                                     )
                                 except InvalidMqlException as exc:
@@ -1051,10 +1174,10 @@ class ModelResourceQueryBuilder(QueryBuilder):
                                         ))
                         else:
                             try:
+                                # Required filters were already applied
+                                # to the default subquery above.
                                 nested_conditions = (
                                     resource.get_required_nested_filters)
-                                subquery = resource.apply_required_filters(
-                                    subquery, alias=last_node.alias)
                                 last_node.subquery = self.apply_filters(
                                         query=subquery,
                                         model_class=last_node.alias,
@@ -1062,7 +1185,7 @@ class ModelResourceQueryBuilder(QueryBuilder):
                                         nested_conditions=nested_conditions,
                                         filters=user_supplied_filters,
                                         convert_key_names_func=(
-                                            resource.convert_key_name),
+                                            resource.get_key_name_converter()),
                                         stack_size_limit=stack_size_limit
                                     ).subquery(inspect(last_node.alias).name)
                             except InvalidMqlException as exc:
@@ -8,21 +8,20 @@
 # :copyright: (c) 2016-2020 by Nicholas Repole and contributors.
 #             See AUTHORS for more details.
 # :license: MIT - See LICENSE for more details.
-import math
 from marshmallow.exceptions import ValidationError
 from mqlalchemy import (
-    InvalidMqlException, MqlFieldError, MqlFieldPermissionError, MqlTooComplex)
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import inspect
+    InvalidMqlException, MqlFieldError, MqlFieldPermissionError)
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy import func, inspect
 from drowsy import resource_class_registry
 from drowsy.base import BaseResourceABC
 from contextlib import suppress
 from drowsy.exc import (
     BadRequestError, PermissionValidationError, PermissionDeniedError)
-from drowsy.fields import (
-    EmbeddableMixinABC, NestedPermissibleABC, Relationship)
+from drowsy.fields import NestedPermissibleABC, Relationship
 from drowsy.log import Loggable
 from drowsy.query_builder import ModelResourceQueryBuilder
+from drowsy.schema import ResourceSchema
 
 
 class PaginationInfo(Loggable):
@@ -41,64 +40,34 @@ class PaginationInfo(Loggable):
 
         """
         self.resources_available = resources_available
-        self._page_size = None
-        self._current_page = None
         self.page_size = page_size
         self.current_page = current_page
 
-    @property
-    def page_size(self):
-        """Get the number of resources included in a result collection.
-
-        :return: The size of each page in a result collection.
-        :rtype: int or None
-
-        """
-        return self._page_size
-
-    @page_size.setter
-    def page_size(self, value):
-        """Set the number of resources included in a result collection.
-
-        :return: The size of each page in a result collection.
-        :rtype: int or None
-
-        """
-        if not isinstance(value, int) and value is not None:
-            raise TypeError("page_size must be an integer or None.")
-        if value is None or value > 0:
-            self._page_size = value
-        else:
-            raise ValueError(
-                "page_size must be an integer greater than 0 or None.")
-
-    @property
-    def current_page(self):
-        """Get the current page of this resource collection.
-
-        :return: The current page of this resource collection.
-        :rtype: int or None
-
-        """
-        return self._current_page
+    def __setattr__(self, name, value):
+        """Validate ``page_size`` and ``current_page`` when set.
 
-    @current_page.setter
-    def current_page(self, value):
-        """Set the current page of this resource collection.
+        These are plain attributes rather than properties, so reading
+        them is a simple attribute lookup.
 
-        :param value: A positive integer or ``None``. Page numbering
-            starts at 1, not 0.
-        :type value: int or None
+        :param str name: Name of the attribute being set.
+        :param value: Value to set the attribute to. For ``page_size``
+            and ``current_page``, must be a positive integer or
+            ``None``. Page numbering starts at 1, not 0.
+        :raise TypeError: If ``page_size`` or ``current_page`` is set
+            to something other than an integer or ``None``.
+        :raise ValueError: If ``page_size`` or ``current_page`` is set
+            to an integer less than 1.
         :return: None
 
         """
-        if not isinstance(value, int) and value is not None:
-            raise TypeError("current_page must be an integer or None.")
-        if value is None or value > 0:
-            self._current_page = value
-        else:
-            raise ValueError(
-                "current_page must be an integer greater than 0 or None.")
+        if value is not None and (
+                name == "page_size" or name == "current_page"):
+            if not isinstance(value, int):
+                raise TypeError("%s must be an integer or None." % name)
+            if value <= 0:
+                raise ValueError(
+                    "%s must be an integer greater than 0 or None." % name)
+        super(PaginationInfo, self).__setattr__(name, value)
 
     @property
     def first_page(self):
@@ -121,8 +90,10 @@ class PaginationInfo(Loggable):
         :rtype: int or None
 
         """
-        if self.page_size is not None:
-            return math.ceil(self.resources_available/(self.page_size * 1.0))
+        page_size = self.page_size
+        if page_size is not None:
+            # Integer ceiling division, avoiding a float round trip.
+            return -(-self.resources_available // page_size)
         return None
 
     @property
@@ -134,9 +105,11 @@ class PaginationInfo(Loggable):
         :rtype: int or None
 
         """
-        if self.current_page is not None and self.page_size is not None:
-            if self.current_page > self.first_page:
-                return self.current_page - 1
+        current_page = self.current_page
+        if current_page is not None and self.page_size is not None:
+            # The first page is always 1 when paginating.
+            if current_page > 1:
+                return current_page - 1
         return None
 
     @property
@@ -148,9 +121,10 @@ class PaginationInfo(Loggable):
         :rtype: int or None
 
         """
-        if self.current_page is not None and self.page_size is not None:
-            if self.current_page < self.last_page:
-                return self.current_page + 1
+        current_page = self.current_page
+        if current_page is not None and self.page_size is not None:
+            if current_page < self.last_page:
+                return current_page + 1
         return None
 
 
@@ -184,7 +158,7 @@ class ResourceCollection(list, PaginationInfo):
         :rtype: int
 
         """
-        return self.__len__()
+        return len(self)
 
 
 class ResourceOpts(object):
@@ -205,6 +179,33 @@ class ResourceOpts(object):
     or ``None`` to specify default page size for this resource. If given
     a `callable`, it should the resource itself as an argument.
 
+    An ``embed_load_strategy`` option may be provided as either
+    ``"joined"`` (the default) or ``"selectin"``. With ``"selectin"``,
+    embedded relationships are loaded with a separate ``SELECT ... IN``
+    query per relationship, as long as the embedded subresources have
+    no required filters or default limit to apply.
+
+    A ``bulk_insert`` option may be set to ``True`` to have
+    :meth:`~drowsy.resource.ModelResource.post_collection` insert new
+    objects using :meth:`~sqlalchemy.orm.session.Session.bulk_save_objects`
+    rather than adding each to the session individually. Bulk saves
+    skip relationship cascades and ORM events, so this should only be
+    enabled for resources whose new objects don't rely on either.
+
+    A ``stream_batch_size`` option may be provided as an `int` to have
+    :meth:`~drowsy.resource.ModelResource.get_collection` stream rows
+    from the database in batches of that size, rather than loading
+    them all before serializing, whenever a page may be larger than a
+    single batch. Only used when no embeds or subfilters are provided,
+    as eagerly loaded relationships can't be streamed.
+
+    A ``window_count`` option may be set to ``True`` to have
+    :meth:`~drowsy.resource.ModelResource.get_collection` fetch the
+    total number of matching resources along with the requested page
+    using ``COUNT(*) OVER ()``, rather than running a separate count
+    query. Only used when no embeds or subfilters are provided, and
+    requires a database that supports window functions.
+
     Example usage:
 
     .. code-block:: python
@@ -217,9 +218,17 @@ class ResourceOpts(object):
                     "validation_failure": "Fix your data."
                 }
                 page_max_size = 100
+                embed_load_strategy = "selectin"
+                bulk_insert = False
+                stream_batch_size = 500
+                window_count = False
 
     """
 
+    __slots__ = ("schema_cls", "error_messages", "page_max_size", "options",
+                 "allowed_methods", "embed_load_strategy", "bulk_insert",
+                 "stream_batch_size", "window_count")
+
     def __init__(self, meta):
         """Handle the meta class attached to a `ModelResource`.
 
@@ -234,6 +243,14 @@ class ResourceOpts(object):
             meta,
             "options",
             ["GET", "POST", "PATCH", "PUT", "DELETE", "HEAD", "OPTIONS"])
+        # Set of options, used to check whether a request method is
+        # allowed. OPTIONS is always allowed.
+        self.allowed_methods = frozenset(list(self.options) + ["OPTIONS"])
+        self.embed_load_strategy = getattr(
+            meta, "embed_load_strategy", "joined")
+        self.bulk_insert = getattr(meta, "bulk_insert", False)
+        self.stream_batch_size = getattr(meta, "stream_batch_size", None)
+        self.window_count = getattr(meta, "window_count", False)
 
 
 class ResourceMeta(type):
@@ -241,8 +258,8 @@ class ResourceMeta(type):
     """Meta class inherited by `ModelResource`.
 
     This is ultimately responsible for attaching an ``opts`` object to
-    :class:`ModelResource`, as well as registering that class with the
-    ``resource_class_registry``.
+    :class:`ModelResource`, merging its default error messages, as well
+    as registering that class with the ``resource_class_registry``.
 
     """
 
@@ -282,6 +299,7 @@ class ResourceMeta(type):
 
         """
         super(ResourceMeta, cls).__init__(name, bases, attrs)
+        cls._get_class_error_messages()
         resource_class_registry.register(name, cls)
 
 
@@ -289,6 +307,9 @@ class BaseModelResource(BaseResourceABC):
 
     """Model API Resources should inherit from this object."""
 
+    __slots__ = ("_session", "_session_is_callable", "_model",
+                 "_query_builder")
+
     OPTIONS_CLASS = ResourceOpts
 
     _default_error_messages = {
@@ -342,7 +363,9 @@ class BaseModelResource(BaseResourceABC):
             page_max_size=page_max_size,
             error_messages=error_messages,
             parent_field=parent_field)
-        self._session = session
+        self.session = session
+        self._model = None
+        self._query_builder = None
 
     def _get_schema_kwargs(self, schema_cls):
         """Get default kwargs for any new schema creation.
@@ -377,13 +400,12 @@ class BaseModelResource(BaseResourceABC):
             `BadRequestError` is returned.
 
         """
-        filter_exceptions = (MqlFieldError, InvalidMqlException, MqlTooComplex)
-        if isinstance(exc, filter_exceptions):
-            if kwargs.get("subresource_key"):
-                prefix = kwargs["subresource_key"] + ": "
-            else:
-                prefix = ""
+        if exc is not None:
             if isinstance(exc, MqlFieldError):
+                if kwargs.get("subresource_key"):
+                    prefix = kwargs["subresource_key"] + ": "
+                else:
+                    prefix = ""
                 if exc.op:
                     kwargs["op"] = exc.op
                 kwargs["value"] = exc.filter
@@ -396,12 +418,17 @@ class BaseModelResource(BaseResourceABC):
                         message=message,
                         errors={},
                         **kwargs)
-            else:
-                message = self._get_error_message(key, **kwargs)
-            return BadRequestError(
-                code=key,
-                message=message,
-                **kwargs)
+                return BadRequestError(
+                    code=key,
+                    message=message,
+                    **kwargs)
+            elif isinstance(exc, InvalidMqlException):
+                # Covers invalid_filters and filters_too_complex, neither
+                # of which needs extra formatting info from the exception.
+                return BadRequestError(
+                    code=key,
+                    message=self._get_error_message(key, **kwargs),
+                    **kwargs)
         return super(BaseModelResource, self).make_error(
             key=key,
             errors=errors,
@@ -412,15 +439,16 @@ class BaseModelResource(BaseResourceABC):
     @property
     def model(self):
         """Get the model class associated with this resource."""
-        return self.schema_cls.opts.model
+        if self._model is None:
+            self._model = self.schema_cls.opts.model
+        return self._model
 
     @property
     def session(self):
         """Get a db session to use for this request."""
-        if callable(self._session):
+        if self._session_is_callable:
             return self._session()
-        else:
-            return self._session
+        return self._session
 
     @session.setter
     def session(self, val):
@@ -430,16 +458,37 @@ class BaseModelResource(BaseResourceABC):
         :type val: dict, callable, or None
 
         """
+        self._session_is_callable = callable(val)
         self._session = val
+        # The lookup schema, and any subresources made from it, hold
+        # on to the session it was created with.
+        self._reset_lookup_caches()
+
+    def _can_cache_lookups(self):
+        """Check whether field lookups may be cached on this resource.
+
+        In addition to a callable context, lookups aren't cached when
+        the session is a callable, as the lookup schema and any
+        subresources created from it would keep the first session.
+
+        :return: ``True`` if lookups may be cached.
+        :rtype: bool
+
+        """
+        return (super(BaseModelResource, self)._can_cache_lookups() and
+                not self._session_is_callable)
 
     @property
     def query_builder(self):
         """Returns a ModelResourceQueryBuilder object.
 
-        This exists mainly for inheritance purposes.
+        This exists mainly for inheritance purposes. The builder holds
+        no state, so one instance is created lazily and reused.
 
         """
-        return ModelResourceQueryBuilder()
+        if self._query_builder is None:
+            self._query_builder = ModelResourceQueryBuilder()
+        return self._query_builder
 
     def _convert_nested_opts(self, nested_opts):
         """Converts the key names for user supplied nested opts.
@@ -451,10 +500,27 @@ class BaseModelResource(BaseResourceABC):
         """
         if not isinstance(nested_opts, dict):
             raise TypeError("Supplied nested_opts must be a dict.")
-        new_nested_opts = {}
-        for key in nested_opts:
-            new_nested_opts[self.convert_key_name(key)] = nested_opts[key]
-        return new_nested_opts
+        convert_key_name = self.get_key_name_converter()
+        return {convert_key_name(key): value
+                for key, value in nested_opts.items()}
+
+    def _commit_or_fail(self, session=None):
+        """Commit the session, rolling back if the commit fails.
+
+        :param session: Session to commit. Defaults to
+            :attr:`session` if not provided.
+        :type session: :class:`~sqlalchemy.orm.session.Session` or None
+        :raise UnprocessableEntityError: If the commit fails.
+        :return: ``None``
+
+        """
+        if session is None:
+            session = self.session
+        try:
+            session.commit()
+        except SQLAlchemyError:  # pragma: no cover
+            session.rollback()
+            raise self.make_error("commit_failure")
 
     def _get_ident_filters(self, ident):
         """Generate MQLAlchemy filters using a resource identity.
@@ -463,18 +529,36 @@ class BaseModelResource(BaseResourceABC):
             See :meth:`get` for more info.
 
         """
-        filters = {}
-        if not (isinstance(ident, tuple) or
-                isinstance(ident, list)):
+        filter_names = self._get_id_filter_names()
+        if not isinstance(ident, (tuple, list)):
+            if len(filter_names) == 1:
+                return {filter_names[0]: ident}
             ident = (ident,)
-        # NOTE: No risk of BadRequestError here due to no embeds or
-        # fields being passed to make_schema
-        schema = self.make_schema()
-        for i, field_name in enumerate(schema.id_keys):
-            field = schema.fields.get(field_name)
-            filter_name = field.data_key or field_name
-            filters[filter_name] = ident[i]
-        return filters
+        elif len(filter_names) == 1:
+            return {filter_names[0]: ident[0]}
+        return {name: ident[i] for i, name in enumerate(filter_names)}
+
+    def _get_id_filter_names(self):
+        """Get the filter names for each of this resource's id keys.
+
+        Identity fields are static for a given resource class, so these
+        are computed once and stored on the class.
+
+        :return: The data key of each id field, in id key order.
+        :rtype: tuple of str
+
+        """
+        cls = self.__class__
+        names = cls.__dict__.get("_class_id_filter_names")
+        if names is None:
+            # Avoid make_schema here, as it replaces self.schema and
+            # does unneeded work processing embeds and fields.
+            schema = self._get_lookup_schema()
+            names = tuple(
+                schema.fields[field_name].data_key or field_name
+                for field_name in schema.id_keys)
+            cls._class_id_filter_names = names
+        return names
 
     def _get_instance(self, ident):
         """Given an identity, get the associated SQLAlchemy instance.
@@ -487,23 +571,158 @@ class BaseModelResource(BaseResourceABC):
 
         """
         filters = self._get_ident_filters(ident)
-        query = self.session.query(self.model)
+        return self._get_ident_query(self.session, ident, filters).first()
+
+    def _get_ident_query(self, session, ident, filters):
+        """Get a query for the resource matching the given identity.
+
+        :param session: Database session to build the query from.
+        :type session: :class:`~sqlalchemy.orm.session.Session`
+        :param ident: A value used to identify this resource.
+            See :meth:`get` for more info.
+        :param dict filters: The result of :meth:`_get_ident_filters`
+            for ``ident``.
+        :raise ResourceNotFoundError: Raised in cases where invalid
+            filters were supplied.
+        :return: A query with ident and required filters applied.
+        :rtype: :class:`~sqlalchemy.orm.query.Query`
+
+        """
+        try:
+            return self.query_builder.apply_resource_filters(
+                session.query(self.model), self, filters)
+        except (TypeError, ValueError, BadRequestError,
+                PermissionDeniedError):
+            # NOTE - Filter errors are only an issue here due to a bad
+            # ident being provided.
+            raise self.make_error("resource_not_found", ident=ident)
+
+    def _can_delete_directly(self):
+        """Check if a single resource can be deleted without loading it.
+
+        Only the case when deleting involves nothing beyond removing
+        the row itself. That is, the model has no relationships that
+        may need cascading or association rows cleaned up, no
+        inheritance, no mapper delete events, and the schema doesn't
+        override :meth:`~drowsy.schema.ResourceSchema.check_permission`.
+
+        A bulk ``DELETE`` skips the ORM's per-instance handling, so
+        session delete events and any cascades configured outside the
+        mapper's relationships are not run for the deleted rows.
+
+        :return: ``True`` if a bulk ``DELETE`` statement can be used.
+        :rtype: bool
+
+        """
+        mapper = inspect(self.model)
+        return bool(
+            not mapper.relationships and
+            mapper.inherits is None and
+            mapper.polymorphic_on is None and
+            not mapper.dispatch.before_delete and
+            not mapper.dispatch.after_delete and
+            not self._checks_permission())
+
+    def _checks_permission(self):
+        """Check if the schema overrides its permission check.
+
+        :return: ``True`` if the schema class overrides
+            :meth:`~drowsy.schema.ResourceSchema.check_permission`.
+        :rtype: bool
+
+        """
+        return (getattr(self.schema_cls, "check_permission", None) is not
+                ResourceSchema.check_permission)
+
+    def _is_single_table_query(self, query):
+        """Check if a query selects from this resource's table alone.
+
+        A query passed in as the ``session`` may include joins or
+        other tables, which a bulk ``DELETE`` can't be issued for.
+
+        :param query: Query for the rows to delete.
+        :type query: :class:`~sqlalchemy.orm.query.Query`
+        :return: ``True`` if the query has no joins and no other
+            tables in its ``FROM`` clause.
+        :rtype: bool
+
+        """
+        froms = query.statement.froms
+        return len(froms) == 1 and froms[0] is inspect(self.model).local_table
+
+    def _bulk_delete(self, query):
+        """Delete every row matching a query with a single statement.
+
+        Instances of the deleted rows that are already loaded in the
+        session are removed from it. Matching instances are found by
+        evaluating the query criteria in Python, or by selecting the
+        matching rows first if the criteria can't be evaluated.
+
+        No ORM delete events or cascades are run for the deleted rows,
+        see :meth:`_can_delete_directly`.
+
+        :param query: Query for the rows to delete.
+        :type query: :class:`~sqlalchemy.orm.query.Query`
+        :return: The number of rows deleted.
+        :rtype: int
+
+        """
+        try:
+            return query.delete(synchronize_session="evaluate")
+        except InvalidRequestError:
+            return query.delete(synchronize_session="fetch")
+
+    def _delete_directly(self, ident):
+        """Delete the identified resource without loading it first.
+
+        :param ident: A value used to identify this resource.
+            See :meth:`get` for more info.
+        :raise ResourceNotFoundError: If no such resource exists.
+        :return: ``None``
+
+        """
+        filters = self._get_ident_filters(ident)
+        session = self.session
+        query = self._get_ident_query(session, ident, filters)
         try:
-            query = self.query_builder.apply_filters(
-                query,
-                model_class=self.model,
-                filters=filters,
-                nested_conditions=self.get_required_nested_filters,
-                whitelist=self.whitelist,
-                stack_size_limit=100,
-                convert_key_names_func=self.convert_key_name,
-                gettext=self.context.get("gettext", None))
-            query = self.apply_required_filters(query)
-        except (TypeError, ValueError, InvalidMqlException, BadRequestError):
-            # NOTE - BadRequestError only an issue on filters,
-            # e.g. a bad ident provided.
+            rowcount = self._bulk_delete(query)
+        except SQLAlchemyError:  # pragma: no cover
+            session.rollback()
+            raise self.make_error("commit_failure")
+        if not rowcount:
             raise self.make_error("resource_not_found", ident=ident)
-        return query.first()
+        self._commit_or_fail(session)
+
+    def _filters_are_empty_set(self, filters):
+        """Check if the provided filters can't possibly match anything.
+
+        Only catches simple cases, such as an ``$in`` with an empty
+        list, either at the top level or nested within ``$and`` or
+        ``$or`` conditions.
+
+        :param filters: MQLAlchemy filters.
+        :type filters: dict or None
+        :return: ``True`` if the filters are known to match no
+            resources, ``False`` otherwise.
+        :rtype: bool
+
+        """
+        if not isinstance(filters, dict):
+            return False
+        for key, value in filters.items():
+            if key == "$and":
+                if isinstance(value, list) and any(
+                        self._filters_are_empty_set(f) for f in value):
+                    return True
+            elif key == "$or":
+                if isinstance(value, list) and value and all(
+                        self._filters_are_empty_set(f) for f in value):
+                    return True
+            elif not key.startswith("$") and isinstance(value, dict):
+                in_values = value.get("$in")
+                if isinstance(in_values, list) and not in_values:
+                    return True
+        return False
 
     def get_required_filters(self, alias=None):
         """Build any required filters for this resource.
@@ -542,41 +761,41 @@ class BaseModelResource(BaseResourceABC):
             Defaults to ``None``.
 
         """
-        schema = self.schema_cls(**self._get_schema_kwargs(self.schema_cls))
+        if key == "":
+            return None
+        # Only field info is read while walking the key, so the shared
+        # lookup schema is used and nothing is embedded on it.
+        schema = self._get_lookup_schema()
         resource = self
         split_keys = key.split(".")
-        if len(split_keys) == 1 and split_keys[0] == "":
-            return None
-        while split_keys:
-            key = split_keys.pop(0)
-            if key in schema.fields:
-                field = schema.fields[key]
-                if isinstance(field, EmbeddableMixinABC):
-                    schema.embed([key])
-                if isinstance(field, NestedPermissibleABC):
-                    with suppress(ValueError, TypeError):
-                        resource = resource.make_subresource(
-                            field.data_key or key)
-                        if not split_keys:
-                            if hasattr(resource,
-                                       "get_required_filters") and callable(
-                                resource.get_required_filters
-                            ):
-                                return resource.get_required_filters()
-                            # Subresource doesn't use required filtering
-                            return None  # pragma: no cover
-                        # not the final resource, continue traversing
-                        schema = resource.schema
-                        continue
-                    # attempting to use the subresource didn't work
-                    # Note - We have the following options:
-                    # 1. Error out
-                    # 2. Fail quietly and return None
-                    return None  # pragma: no cover
-                else:
-                    # Note - Could be an error
-                    # Defaulting to failing quietly
-                    return None  # pragma: no cover
+        last_index = len(split_keys) - 1
+        for index, key in enumerate(split_keys):
+            field = schema.fields.get(key)
+            if field is None:
+                continue
+            if isinstance(field, NestedPermissibleABC):
+                with suppress(ValueError, TypeError):
+                    resource = resource.make_subresource(
+                        field.data_key or key)
+                    if index == last_index:
+                        if hasattr(resource,
+                                   "get_required_filters") and callable(
+                            resource.get_required_filters
+                        ):
+                            return resource.get_required_filters()
+                        # Subresource doesn't use required filtering
+                        return None  # pragma: no cover
+                    # not the final resource, continue traversing
+                    schema = resource._get_lookup_schema()
+                    continue
+                # attempting to use the subresource didn't work
+                # Note - We have the following options:
+                # 1. Error out
+                # 2. Fail quietly and return None
+                return None  # pragma: no cover
+            # Note - Could be an error
+            # Defaulting to failing quietly
+            return None  # pragma: no cover
 
     def apply_required_filters(self, query, alias=None):
         """Apply required filters on this query.
@@ -597,9 +816,13 @@ class BaseModelResource(BaseResourceABC):
         :rtype: :class:`~sqlalchemy.orm.query.Query`
 
         """
+        if (type(self).get_required_filters is
+                BaseModelResource.get_required_filters):
+            # Not overridden, so there are never any filters to apply.
+            return query
         filters = self.get_required_filters(alias=alias)
         if filters is not None:
-            if isinstance(filters, list) or isinstance(filters, tuple):
+            if isinstance(filters, (list, tuple)):
                 if filters:
                     # this looks redundant, but it's checking if
                     # the collection is empty rather than None
@@ -608,8 +831,49 @@ class BaseModelResource(BaseResourceABC):
                 return query.filter(filters)
         return query
 
+    def _get_model_query(self, session):
+        """Get a query for this resource's model.
+
+        :param session: See :meth:`get` for more info.
+        :type session: :class:`~sqlalchemy.orm.session.Session` or
+            :class:`~sqlalchemy.orm.query.Query`
+        :return: A new query for :attr:`model` if given a session,
+            otherwise the provided query itself.
+        :rtype: :class:`~sqlalchemy.orm.query.Query`
+
+        """
+        session_query = getattr(session, "query", None)
+        if callable(session_query):
+            return session_query(self.model)
+        return session
+
+    def _get_query_base(self, session, filters):
+        """Get a query with only this request's filters applied.
+
+        The result can be used both for counting matching resources
+        and as the starting point for :meth:`_get_query`, so filters
+        only need to be processed once per request.
+
+        :param session: See :meth:`get` for more info.
+        :type session: :class:`~sqlalchemy.orm.session.Session` or
+            :class:`~sqlalchemy.orm.query.Query`
+        :param filters: MQLAlchemy filters to be applied on this query.
+        :type filters: dict or None
+        :raise BadRequestError: If the filters are invalid.
+        :return: A query with user supplied and required filters
+            applied.
+        :rtype: :class:`~sqlalchemy.orm.query.Query`
+
+        """
+        return self.query_builder.apply_resource_filters(
+            query=self._get_model_query(session),
+            resource=self,
+            filters=filters,
+            stack_size_limit=100)
+
     def _get_query(self, session, filters, subfilters=None, embeds=None,
-                   limit=None, offset=None, sorts=None, strict=True):
+                   limit=None, offset=None, sorts=None, strict=True,
+                   filters_applied=False):
         """Used to generate a query for this request.
 
         :param session: See :meth:`get` for more info.
@@ -627,6 +891,9 @@ class BaseModelResource(BaseResourceABC):
         :param bool strict: If ``True``, will raise an exception when
             bad parameters are passed. If ``False``, will quietly ignore
             any bad input and treat it as if none was provided.
+        :param bool filters_applied: ``True`` if ``session`` is a query
+            returned by :meth:`_get_query_base`, meaning ``filters``
+            have already been applied.
         :raise BadRequestError: Invalid filters or embeds will
             result in a raised exception if ``strict`` is ``True``.
         :return: A query with load options applied based on the supplied
@@ -636,10 +903,7 @@ class BaseModelResource(BaseResourceABC):
             :class:`~sqlalchemy.orm.query.Query`
 
         """
-        if hasattr(session, "query") and callable(session.query):
-            query = session.query(self.model)
-        else:
-            query = session
+        query = self._get_model_query(session)
         # apply filters
         # Note that required filters are applied by query builder too
         query = self.query_builder.build(
@@ -653,7 +917,9 @@ class BaseModelResource(BaseResourceABC):
             sorts=sorts,
             strict=strict,
             stack_size_limit=100,
-            dialect_override=None)
+            dialect_override=None,
+            embed_strategy=self.opts.embed_load_strategy,
+            filters_applied=filters_applied)
         return query
 
     @property
@@ -680,10 +946,15 @@ class BaseModelResource(BaseResourceABC):
             is not allowed.
 
         """
-        if method.upper() in self.options or (
-                method.upper() == "OPTIONS"):
+        method = method.upper()
+        if type(self).options is BaseModelResource.options:
+            allowed_methods = self.opts.allowed_methods
+        else:
+            # An overridden options property takes precedence.
+            allowed_methods = self.options
+        if method in allowed_methods or method == "OPTIONS":
             return True
-        raise self.make_error("method_not_allowed", method=method.upper())
+        raise self.make_error("method_not_allowed", method=method)
 
     def get(self, ident, subfilters=None, fields=None, embeds=None,
             session=None, strict=True, head=False):
@@ -723,16 +994,14 @@ class BaseModelResource(BaseResourceABC):
 
         """
         self._check_method_allowed("GET" if not head else "HEAD")
-        filters = self._get_ident_filters(ident)
-        if session is None:
-            session = self.session
-        # NOTE: No risk of BadRequestError here due to no embeds or
-        # fields being passed to make_schema
         schema = self.make_schema(
             fields=fields,
             subfilters=subfilters,
             embeds=embeds,
             strict=strict)
+        filters = self._get_ident_filters(ident)
+        if session is None:
+            session = self.session
         try:
             query = self._get_query(
                 session=session,
@@ -747,24 +1016,33 @@ class BaseModelResource(BaseResourceABC):
             raise exc
         except (ValueError, TypeError, InvalidMqlException):  # pragma: no cover
             raise self.make_error("unexpected_error")
-        instance = query.all()
-        if instance:
-            return schema.dump(instance[0])
+        if embeds or subfilters:
+            # Embedded subresources are joined in, one row per child,
+            # so every row is needed to fully populate them.
+            instances = query.all()
+            instance = instances[0] if instances else None
+        else:
+            instance = query.first()
+        if instance is not None:
+            return schema.dump(instance)
         raise self.make_error("resource_not_found", ident=ident)
 
-    def post(self, data, nested_opts=None):
+    def post(self, data, nested_opts=None, return_body=True):
         """Create a new resource and store it in the db.
 
         :param dict data: Data used to create a new resource.
         :param dict|None nested_opts: Any explicit nested load options.
             These can be used to control whether a nested resource
             collection should be replaced entirely or only modified.
+        :param bool return_body: If ``False``, the created resource
+            isn't fetched and serialized after being committed.
         :raise UnprocessableEntityError: If the supplied data cannot be
             processed.
         :raise MethodNotAllowedError: If this method hasn't been marked
             as allowed in the meta class options.
-        :return: The created resource.
-        :rtype: dict
+        :return: The created resource, or ``None`` if ``return_body``
+            is ``False``.
+        :rtype: dict or None
 
         """
         self._check_method_allowed("POST")
@@ -785,18 +1063,13 @@ class BaseModelResource(BaseResourceABC):
             self.session.rollback()
             raise self.make_error("validation_failure", errors=exc.messages)
         self.session.add(instance)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
-        ident = []
-        for key in schema.id_keys:
-            ident.append(getattr(instance, key))
-        ident = tuple(ident)
+        self._commit_or_fail()
+        if not return_body:
+            return None
+        ident = tuple(getattr(instance, key) for key in schema.id_keys)
         return self.get(ident, embeds=self._get_embed_history(schema))
 
-    def put(self, ident, data, nested_opts=None):
+    def put(self, ident, data, nested_opts=None, return_body=True):
         """Replace the current object with the supplied one.
 
         :param ident: A value used to identify this resource.
@@ -805,46 +1078,24 @@ class BaseModelResource(BaseResourceABC):
         :param dict|None nested_opts: Any explicit nested load options.
             These can be used to control whether a nested resource
             collection should be replaced entirely or only modified.
+        :param bool return_body: If ``False``, the replaced resource
+            isn't fetched and serialized after being committed.
         :raise ResourceNotFoundError: If no such resource exists.
         :raise UnprocessableEntityError: If the supplied data cannot be
             processed.
         :raise MethodNotAllowedError: If this method hasn't been marked
             as allowed in the meta class options.
-        :return: The replaced resource.
-        :rtype: dict
+        :return: The replaced resource, or ``None`` if ``return_body``
+            is ``False``.
+        :rtype: dict or None
 
         """
         self._check_method_allowed("PUT")
-        nested_opts = nested_opts or {}
-        instance = self._get_instance(ident)
-        if not instance:
-            raise self.make_error("resource_not_found", ident=ident)
-        # NOTE: No risk of BadRequestError here due to no embeds or
-        # fields being passed to make_schema
-        schema = self.make_schema(
-            partial=False,
-            instance=instance)
-        try:
-            schema.load(
-                data,
-                instance=instance,
-                session=self.session,
-                nested_opts=self._convert_nested_opts(nested_opts),
-                action="update")
-        except PermissionValidationError:
-            self.session.rollback()
-            raise self.make_error("permission_denied")
-        except ValidationError as exc:
-            self.session.rollback()
-            raise self.make_error("validation_failure", errors=exc.messages)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
-        return self.get(ident, embeds=self._get_embed_history(schema))
+        return self._update(
+            ident, data, nested_opts=nested_opts, return_body=return_body,
+            partial=False)
 
-    def patch(self, ident, data, nested_opts=None):
+    def patch(self, ident, data, nested_opts=None, return_body=True):
         """Update the identified resource with the supplied data.
 
         :param ident: A value used to identify this resource.
@@ -853,24 +1104,53 @@ class BaseModelResource(BaseResourceABC):
         :param dict|None nested_opts: Any explicit nested load options.
             These can be used to control whether a nested resource
             collection should be replaced entirely or only modified.
+        :param bool return_body: If ``False``, the updated resource
+            isn't fetched and serialized after being committed.
         :raise ResourceNotFoundError: If no such resource exists.
         :raise UnprocessableEntityError: If the supplied data cannot be
             processed.
         :raise MethodNotAllowedError: If this method hasn't been marked
             as allowed in the meta class options.
-        :return: The updated resource.
-        :rtype: dict
+        :return: The updated resource, or ``None`` if ``return_body``
+            is ``False``.
+        :rtype: dict or None
 
         """
-        # Refactor - Only three lines here different from put.
         # TODO - deleting a subresource calls patch, odd error potential
         self._check_method_allowed("PATCH")
+        return self._update(
+            ident, data, nested_opts=nested_opts, return_body=return_body,
+            partial=True)
+
+    def _update(self, ident, data, nested_opts=None, return_body=True,
+                partial=False):
+        """Update the identified resource, shared by put and patch.
+
+        :param ident: A value used to identify this resource.
+            See :meth:`get` for more info.
+        :param dict data: Data used to update the resource.
+        :param dict|None nested_opts: Any explicit nested load options.
+        :param bool return_body: If ``False``, the updated resource
+            isn't fetched and serialized after being committed.
+        :param bool partial: ``True`` for a partial update, as with
+            :meth:`patch`, or ``False`` to replace the resource, as with
+            :meth:`put`.
+        :raise ResourceNotFoundError: If no such resource exists.
+        :raise UnprocessableEntityError: If the supplied data cannot be
+            processed.
+        :return: The updated resource, or ``None`` if ``return_body``
+            is ``False``.
+        :rtype: dict or None
+
+        """
         nested_opts = nested_opts or {}
         instance = self._get_instance(ident)
+        if not instance:
+            raise self.make_error("resource_not_found", ident=ident)
         # NOTE: No risk of BadRequestError here due to no embeds or
         # fields being passed to make_schema
         schema = self.make_schema(
-            partial=True,
+            partial=partial,
             instance=instance)
         try:
             schema.load(
@@ -885,11 +1165,9 @@ class BaseModelResource(BaseResourceABC):
         except ValidationError as exc:
             self.session.rollback()
             raise self.make_error("validation_failure", errors=exc.messages)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
+        self._commit_or_fail()
+        if not return_body:
+            return None
         return self.get(ident, embeds=self._get_embed_history(schema))
 
     def _get_embed_history(self, schema, data_key=None):
@@ -908,21 +1186,21 @@ class BaseModelResource(BaseResourceABC):
 
         """
         results = set()
-        key = data_key or ""
-        found = False
-        for field_key in schema.fields:
-            field = schema.fields[field_key]
-            if isinstance(field, Relationship) and field.embedded:
-                child_key = field.data_key or field.name
-                children = self._get_embed_history(field.schema, child_key)
-                for child in children:
+        # Walk embedded relationships with a stack rather than
+        # recursing, keeping only the deepest embedded paths.
+        stack = [(schema, data_key or "")]
+        while stack:
+            schema, key = stack.pop()
+            found = False
+            for field in schema.fields.values():
+                if isinstance(field, Relationship) and field.embedded:
+                    child_key = field.data_key or field.name
                     if key:
-                        results.add(".".join([key, child]))
-                    else:
-                        results.add(child)
-                found = True
-        if not found and key:
-            results.add(key)
+                        child_key = key + "." + child_key
+                    stack.append((field.schema, child_key))
+                    found = True
+            if not found and key:
+                results.add(key)
         return results
 
     def delete(self, ident):
@@ -937,22 +1215,24 @@ class BaseModelResource(BaseResourceABC):
 
         """
         self._check_method_allowed("DELETE")
+        if self._can_delete_directly():
+            return self._delete_directly(ident)
         instance = self._get_instance(ident)
         if instance:
-            schema = self.make_schema(
-                partial=True,
-                instance=instance)
-            try:
-                schema.check_permission(
-                    data={}, instance=instance, action="delete")
-            except PermissionValidationError:
-                raise self.make_error("permission_denied")
+            if self._checks_permission():
+                # Only a permission check is needed, so build the
+                # schema directly rather than going through
+                # make_schema.
+                kwargs = self._get_schema_kwargs(self.schema_cls)
+                kwargs.update(partial=True, instance=instance)
+                schema = self.schema_cls(**kwargs)
+                try:
+                    schema.check_permission(
+                        data={}, instance=instance, action="delete")
+                except PermissionValidationError:
+                    raise self.make_error("permission_denied")
             self.session.delete(instance)
-            try:
-                self.session.commit()
-            except SQLAlchemyError:  # pragma: no cover
-                self.session.rollback()
-                raise self.make_error("commit_failure")
+            self._commit_or_fail()
         else:
             raise self.make_error("resource_not_found", ident=ident)
 
@@ -1009,32 +1289,61 @@ class BaseModelResource(BaseResourceABC):
             subfilters=subfilters,
             embeds=embeds,
             strict=strict)
-        count = self._get_query(
+        # Filters are applied once, with the result shared by the count
+        # and data queries.
+        base_query = self._get_query_base(
             session=session,
-            filters=filters
-        ).count()
+            filters=filters)
         # set up offset/limit
+        page_max_size = self.page_max_size
         if (limit is not None and
-                isinstance(self.page_max_size, int) and
-                limit > self.page_max_size):
+                isinstance(page_max_size, int) and
+                limit > page_max_size):
             if strict:
                 raise self.make_error(
                     "limit_too_high",
                     limit=limit,
-                    max_page_size=self.page_max_size)
-            limit = self.page_max_size
+                    max_page_size=page_max_size)
+            limit = page_max_size
         if not offset:
             offset = 0
         query = self._get_query(
-            session=session,
+            session=base_query,
             filters=filters,
             subfilters=subfilters,
             embeds=embeds,
             limit=limit,
             offset=offset,
             sorts=sorts,
-            strict=strict)
-        records = query.all()
+            strict=strict,
+            filters_applied=True)
+        # Queries are fully built (and validated) at this point, but
+        # there's no need to hit the database when the outcome is
+        # already known.
+        if self._filters_are_empty_set(filters):
+            return ResourceCollection([], 0)
+        if limit == 0:
+            return ResourceCollection([], base_query.count())
+        if self.opts.window_count and not embeds and not subfilters:
+            # Fetch the total alongside the page in a single query.
+            rows = query.add_columns(func.count().over()).all()
+            if rows:
+                count = rows[0][1]
+            elif offset:
+                # The page is past the end, so no row carries a total.
+                count = base_query.count()
+            else:
+                count = 0
+            dump = schema.dump([row[0] for row in rows], many=True)
+            return ResourceCollection(dump, count)
+        count = base_query.count()
+        batch_size = self.opts.stream_batch_size
+        if (batch_size and not embeds and not subfilters and
+                (limit is None or limit > batch_size)):
+            records = query.yield_per(batch_size).execution_options(
+                stream_results=True)
+        else:
+            records = query.all()
         # get result
         dump = schema.dump(records, many=True)
         return ResourceCollection(dump, count)
@@ -1060,17 +1369,28 @@ class BaseModelResource(BaseResourceABC):
         errors = {}
         validation_failure = False
         permission_failure = False
+        # NOTE: No risk of BadRequestError here due to no embeds or
+        # fields being passed to make_schema
+        # A single schema is reused for every object in the batch;
+        # load resets its instance state for each object.
+        schema = self.make_schema(partial=False)
+        converted_nested_opts = self._convert_nested_opts(nested_opts)
+        session = self.session
+        bulk_insert = self.opts.bulk_insert
+        bulk_instances = []
         for i, obj in enumerate(data):
-            # NOTE: No risk of BadRequestError here due to no embeds or
-            # fields being passed to make_schema
-            schema = self.make_schema(partial=False)
             try:
                 instance = schema.load(
                     obj,
-                    session=self.session,
-                    nested_opts=self._convert_nested_opts(nested_opts),
+                    session=session,
+                    nested_opts=converted_nested_opts,
                     action="create")
-                self.session.add(instance)
+                if not bulk_insert:
+                    session.add(instance)
+                elif instance not in session:
+                    # Instances cascaded into the session already
+                    # (e.g. via a backref) get flushed on commit.
+                    bulk_instances.append(instance)
             except PermissionValidationError as exc:
                 errors[i] = exc.messages
                 permission_failure = True
@@ -1083,11 +1403,13 @@ class BaseModelResource(BaseResourceABC):
         elif validation_failure:
             self.session.rollback()
             raise self.make_error("validation_failure", errors=errors)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
+        if bulk_instances:
+            try:
+                session.bulk_save_objects(bulk_instances)
+            except SQLAlchemyError:
+                session.rollback()
+                raise self.make_error("commit_failure")
+        self._commit_or_fail(session)
 
     def put_collection(self, data, nested_opts=None):
         """Raises an error since this method has no obvious use.
@@ -1130,31 +1452,41 @@ class BaseModelResource(BaseResourceABC):
         validation_failure = False
         if not isinstance(data, list):
             raise self.make_error("invalid_collection_input")
+        # NOTE: No risk of BadRequestError here due to no embeds
+        # or fields being passed to make_schema
+        # Schemas are built lazily and reused for the rest of the batch.
+        add_schema = None
+        update_schema = None
+        converted_nested_opts = self._convert_nested_opts(nested_opts)
+        session = self.session
         for i, obj in enumerate(data):
             try:
-                if obj.get("$op") == "add":
+                op = obj.get("$op")
+                if op == "add":
                     # basically a post
-                    # NOTE: No risk of BadRequestError here due to no embeds
-                    # or fields being passed to make_schema
-                    schema = self.make_schema(partial=False)
+                    if add_schema is None:
+                        add_schema = self.make_schema(partial=False)
+                    schema = add_schema
                     action = "create"
-                elif obj.get("$op") == "remove":
-                    # basically a delete
-                    schema = self.make_schema(partial=True)
-                    action = "delete"
                 else:
-                    schema = self.make_schema(partial=True)
-                    action = "update"
+                    if update_schema is None:
+                        update_schema = self.make_schema(partial=True)
+                    schema = update_schema
+                    if op == "remove":
+                        # basically a delete
+                        action = "delete"
+                    else:
+                        action = "update"
                 instance = schema.load(
                     obj,
-                    session=self.session,
-                    nested_opts=self._convert_nested_opts(nested_opts),
+                    session=session,
+                    nested_opts=converted_nested_opts,
                     action=action)
                 if action == "create":
-                    self.session.add(instance)
+                    session.add(instance)
                 if action == "delete":
                     if inspect(instance).persistent:
-                        self.session.delete(instance)
+                        session.delete(instance)
                     else:
                         # NOTE - Not sure how to handle.
                         # Should probably have schema.load raise a
@@ -1174,11 +1506,7 @@ class BaseModelResource(BaseResourceABC):
         elif validation_failure:
             self.session.rollback()
             raise self.make_error("validation_failure", errors=errors)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
+        self._commit_or_fail()
 
     def delete_collection(self, filters=None, session=None, strict=True):
         """Delete all filter matching members of the collection.
@@ -1206,23 +1534,33 @@ class BaseModelResource(BaseResourceABC):
             session=session,
             filters=filters,
             strict=strict)
-        instances = query.all()
-        for instance in instances:
-            # NOTE: No risk of BadRequestError here due to no embeds
-            # or fields being passed to make_schema
-            schema = self.make_schema(partial=True)
+        if (self._can_delete_directly() and
+                self._is_single_table_query(query)):
             try:
-                schema.check_permission(data={}, instance=instance,
-                                        action="delete")
-            except PermissionValidationError:
+                rowcount = self._bulk_delete(query)
+            except SQLAlchemyError:  # pragma: no cover
                 self.session.rollback()
-                raise self.make_error("permission_denied")
+                raise self.make_error("commit_failure")
+            if rowcount:
+                self._commit_or_fail()
+            return None
+        instances = query.all()
+        schema = None
+        if self._checks_permission():
+            # A single schema is enough to check every instance.
+            kwargs = self._get_schema_kwargs(self.schema_cls)
+            kwargs["partial"] = True
+            schema = self.schema_cls(**kwargs)
+        for instance in instances:
+            if schema is not None:
+                try:
+                    schema.check_permission(data={}, instance=instance,
+                                            action="delete")
+                except PermissionValidationError:
+                    self.session.rollback()
+                    raise self.make_error("permission_denied")
             self.session.delete(instance)
-        try:
-            self.session.commit()
-        except SQLAlchemyError:  # pragma: no cover
-            self.session.rollback()
-            raise self.make_error("commit_failure")
+        self._commit_or_fail()
 
 
 class ModelResource(BaseModelResource, metaclass=ResourceMeta):
@@ -259,13 +259,16 @@ class ResourceRouterABC(Loggable):
         """
         raise NotImplementedError
 
-    def put(self, path, data):
+    def put(self, path, data, return_body=True):
         """Generic API router for PUT requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of entities to
             replace the current value with at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a put to a subresource collection, the
             replaced subresource is returned.
             If this is a put to an individual resource then the
@@ -280,13 +283,16 @@ class ResourceRouterABC(Loggable):
         """
         raise NotImplementedError
 
-    def patch(self, path, data):
+    def patch(self, path, data, return_body=True):
         """Generic API router for PATCH requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of entities to
             add or remove at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a patch to a resource collection, ``None``
             is returned.
             If this is a patch to a subresource collection, the
@@ -303,13 +309,16 @@ class ResourceRouterABC(Loggable):
         """
         raise NotImplementedError
 
-    def post(self, path, data):
+    def post(self, path, data, return_body=True):
         """Generic API router for POST requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of new entities to
             add at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a post to a top level resource, then the
             newly created resource or list of resources will be returned
             in dict or list of dicts form.
@@ -345,7 +354,7 @@ class ResourceRouterABC(Loggable):
         raise NotImplementedError
 
     def dispatcher(self, method, path, query_params=None, data=None,
-                   strict=True):
+                   strict=True, return_body=True):
         """Route requests based on path and resource.
 
         :param str method: HTTP verb method used to make this request.
@@ -358,6 +367,9 @@ class ResourceRouterABC(Loggable):
             silently ignoring them.
         :param data: The data supplied as part of the incoming request
             body. Optional, and the format of this data may vary.
+        :param bool return_body: If ``False``, post, patch, and put
+            requests to an individual or top level resource return
+            ``None`` rather than the written resource.
         :raise ResourceNotFoundError: If no resource can be found at
             the provided path.
         :raise BadRequestError: Invalid filters, sorts, fields,
@@ -394,12 +406,13 @@ class ResourceRouterABC(Loggable):
             return self.get(path, query_params, strict, head)
         elif method.lower() == "delete":
             return self.delete(path, query_params)
-        elif method.lower() == "patch":
-            return self.patch(path, data)
-        elif method.lower() == "put":
-            return self.put(path, data)
-        elif method.lower() == "post":
-            return self.post(path, data)
+        elif method.lower() in ("patch", "put", "post"):
+            write = getattr(self, method.lower())
+            if return_body:
+                # Leave return_body out, so routers overriding these
+                # methods with a (path, data) signature keep working.
+                return write(path, data)
+            return write(path, data, return_body=False)
         elif method.lower() == "options":
             return self.options(path)
         else:
@@ -730,13 +743,16 @@ class ModelResourceRouter(ResourceRouterABC):
                 )
                 raise reformatted_error
 
-    def put(self, path, data):
+    def put(self, path, data, return_body=True):
         """Generic API router for PUT requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of entities to
             replace the current value with at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a put to a subresource collection, the
             replaced subresource is returned.
             If this is a put to an individual resource then the
@@ -762,7 +778,8 @@ class ModelResourceRouter(ResourceRouterABC):
             # put collection
             return resource.put_collection(data=data)
         elif isinstance(path_part, tuple):
-            return resource.put(ident, data=data)
+            return resource.put(
+                ident, data=data, return_body=return_body)
         else:
             # Dealing with a subresource, so this is treated
             # more as a patch/update to that subresource.
@@ -782,13 +799,16 @@ class ModelResourceRouter(ResourceRouterABC):
             path=path,
             method="PUT")
 
-    def patch(self, path, data):
+    def patch(self, path, data, return_body=True):
         """Generic API router for PATCH requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of entities to
             add or remove at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a patch to a resource collection, ``None``
             is returned.
             If this is a patch to a subresource collection, the
@@ -815,7 +835,8 @@ class ModelResourceRouter(ResourceRouterABC):
             # patch collection
             return resource.patch_collection(data=data)
         elif isinstance(path_part, tuple):
-            return resource.patch(ident, data=data)
+            return resource.patch(
+                ident, data=data, return_body=return_body)
         else:
             # Dealing with a subresource, so this is treated
             # more as a patch/update to that subresource.
@@ -835,13 +856,16 @@ class ModelResourceRouter(ResourceRouterABC):
             method="PATCH"
         )
 
-    def post(self, path, data):
+    def post(self, path, data, return_body=True):
         """Generic API router for POST requests.
 
         :param str path: The resource path specified. This should not
             include the root ``/api`` or any versioning info.
         :param data: A dict or list of dicts of new entities to
             add at the given path.
+        :param bool return_body: If ``False``, a write to an individual
+            or top level resource returns ``None`` rather than the
+            written resource, avoiding the cost of serializing it.
         :return: If this is a post to a top level resource, then the
             newly created resource or list of resources will be returned
             in dict or list of dicts form.
@@ -865,7 +889,7 @@ class ModelResourceRouter(ResourceRouterABC):
             if isinstance(data, list):
                 return resource.post_collection(data=data)
             else:
-                return resource.post(data=data)
+                return resource.post(data=data, return_body=return_body)
         else:
             # Dealing with a subresource, so this is treated
             # more as a patch/update to that subresource.
@@ -951,8 +975,7 @@ class ModelResourceRouter(ResourceRouterABC):
                 return result[field_name]
             raise self.make_error(
                 "resource_not_found", path=path)  # pragma: no cover
-        if isinstance(path_part, Field) or isinstance(
-                path_part, BaseModelResource):
+        if isinstance(path_part, (Field, BaseModelResource)):
             # resource collection
             # any non subresource field would already have been handled
             try:
@@ -270,13 +270,13 @@ class ResourceSchema(Schema, Loggable):
         :rtype: dict
 
         """
-        if (not hasattr(self, "_fields_by_data_key") or
-                self._fields_by_data_key is None):
-            self._fields_by_data_key = {}
-            for key in self.fields:
-                field = self.fields[key]
-                self._fields_by_data_key[field.data_key or key] = field
-        return self._fields_by_data_key
+        fields_by_data_key = getattr(self, "_fields_by_data_key", None)
+        if fields_by_data_key is None:
+            fields_by_data_key = {
+                field.data_key or key: field
+                for key, field in self.fields.items()}
+            self._fields_by_data_key = fields_by_data_key
+        return fields_by_data_key
 
     def get_instance(self, data):
         """Used primarily to retrieve a pre-existing instance.
@@ -55,14 +55,43 @@ def get_field_by_data_key(schema, data_key):
     :rtype: :class:`~marshmallow.fields.Field` or None
 
     """
-    field = None
-    if hasattr(schema, "fields_by_data_key"):
-        if data_key in schema.fields_by_data_key:
-            field = schema.fields_by_data_key[data_key]
-    else:
-        for field_name in schema.fields:
-            field_data_name = schema.fields[field_name].data_key or field_name
-            if field_data_name == data_key:
-                field = schema.fields[field_name]
-                break
-    return field
+    fields_by_data_key = getattr(schema, "fields_by_data_key", None)
+    if fields_by_data_key is not None:
+        return fields_by_data_key.get(data_key)
+    for field_name, field in schema.fields.items():
+        if (field.data_key or field_name) == data_key:
+            return field
+    return None
+
+
+class MemoizingDict(dict):
+
+    """Dictionary that fills in missing keys using a function.
+
+    Looking up a missing key calls the provided function with that key,
+    stores the result, and returns it. Useful for passing
+    ``memoizing_dict.__getitem__`` in place of a deterministic function
+    that would otherwise be called repeatedly with the same arguments.
+
+    """
+
+    def __init__(self, func):
+        """Create a new memoizing dictionary.
+
+        :param callable func: Takes a key as its only argument and
+            returns the value to store for it.
+
+        """
+        super(MemoizingDict, self).__init__()
+        self.func = func
+
+    def __missing__(self, key):
+        """Compute, store, and return the value for a missing key.
+
+        :param key: The key that was not found.
+        :return: The result of calling ``func`` with ``key``.
+
+        """
+        value = self.func(key)
+        self[key] = value
+        return value
@@ -32,6 +32,12 @@ class AlbumResource(ModelResource):
         schema_cls = AlbumSchema
 
 
+class AlbumSelectinResource(ModelResource):
+    class Meta:
+        schema_cls = AlbumSchema
+        embed_load_strategy = "selectin"
+
+
 class InvoiceLineResource(ModelResource):
     class Meta:
         schema_cls = InvoiceLineSchema
@@ -67,6 +73,24 @@ class MediaTypeResource(ModelResource):
         schema_cls = MediaTypeSchema
 
 
+class MediaTypeBulkResource(ModelResource):
+    class Meta:
+        schema_cls = MediaTypeSchema
+        bulk_insert = True
+
+
+class TrackStreamResource(ModelResource):
+    class Meta:
+        schema_cls = TrackSchema
+        stream_batch_size = 100
+
+
+class TrackWindowCountResource(ModelResource):
+    class Meta:
+        schema_cls = TrackSchema
+        window_count = True
+
+
 class GenreResource(ModelResource):
     class Meta:
         schema_cls = GenreSchema
@@ -123,6 +147,16 @@ class AlbumCamelResource(ModelResource):
         schema_cls = AlbumCamelSchema
 
 
+class AlbumIdAliasResource(ModelResource):
+    class Meta:
+        schema_cls = AlbumSchema
+
+    def convert_key_name(self, key):
+        if key == "id":
+            key = "album_id"
+        return super(AlbumIdAliasResource, self).convert_key_name(key)
+
+
 class InvoiceLineCamelResource(ModelResource):
     class Meta:
         schema_cls = InvoiceLineCamelSchema
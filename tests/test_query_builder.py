@@ -10,6 +10,7 @@
 # :license: MIT - See LICENSE for more details.
 from pytest import raises
 from sqlalchemy.inspection import inspect
+from unittest.mock import MagicMock
 from drowsy.exc import BadRequestError
 from drowsy.query_builder import QueryBuilder, ModelResourceQueryBuilder
 from drowsy.parser import SubfilterInfo, SortInfo
@@ -74,6 +75,85 @@ class TestDrowsyQueryBuilder(DrowsyDatabaseTests):
                 query=query,
                 offset=-1)
 
+    @staticmethod
+    def test_build_filters_applied(db_session):
+        """Test building from a query that already has filters."""
+        query_builder = ModelResourceQueryBuilder()
+        resource = AlbumResource(session=db_session)
+        query = query_builder.apply_resource_filters(
+            query=db_session.query(Album),
+            resource=resource,
+            filters={"album_id": {"$lt": 3}})
+        query = query_builder.build(
+            query=query,
+            resource=resource,
+            filters={"album_id": 1},
+            subfilters=None,
+            embeds=["artist"],
+            filters_applied=True)
+        results = query.all()
+        assert [album.album_id for album in results] == [1, 2]
+        assert results[0].artist.artist_id == 1
+
+    @staticmethod
+    def test_apply_resource_filters_empty(db_session):
+        """Test empty filters skip filter parsing entirely."""
+        query_builder = ModelResourceQueryBuilder()
+        query_builder.apply_filters = MagicMock()
+        resource = AlbumResource(session=db_session)
+        query = query_builder.apply_resource_filters(
+            query=db_session.query(Album),
+            resource=resource,
+            filters={})
+        assert not query_builder.apply_filters.called
+        assert query.count() == db_session.query(Album).count()
+
+    @staticmethod
+    def test_build_int_convertible_limit(db_session):
+        """Test that integer convertible limits and offsets are used."""
+        query_builder = ModelResourceQueryBuilder()
+        for limit, offset in (("5", "1"), (5.0, 1.0)):
+            query = query_builder.build(
+                query=db_session.query(Album),
+                resource=AlbumResource(session=db_session),
+                filters=None,
+                subfilters=None,
+                limit=limit,
+                offset=offset,
+                strict=True)
+            results = query.all()
+            assert len(results) == 5
+            assert results[0].album_id == 2
+
+    @staticmethod
+    def test_build_non_int_limit_fail(db_session):
+        """Test that a non integer limit fails in strict mode."""
+        query_builder = ModelResourceQueryBuilder()
+        query = db_session.query(Album)
+        with raises(BadRequestError) as excinf:
+            query_builder.build(
+                query=query,
+                resource=AlbumResource(session=db_session),
+                filters=None,
+                subfilters=None,
+                limit="test",
+                strict=True)
+        assert excinf.value.code == "invalid_limit_value"
+
+    @staticmethod
+    def test_build_non_int_offset_ignore(db_session):
+        """Test that a non integer offset is ignored when not strict."""
+        query_builder = ModelResourceQueryBuilder()
+        query = db_session.query(Album)
+        query = query_builder.build(
+            query=query,
+            resource=AlbumResource(session=db_session),
+            filters=None,
+            subfilters=None,
+            offset="test",
+            strict=False)
+        assert query.first().album_id == 1
+
     @staticmethod
     def test_simple_subfilter(db_session):
         """Test applying a simple subfilter."""
@@ -432,6 +512,68 @@ class TestDrowsyQueryBuilder(DrowsyDatabaseTests):
             res = inspect(album)
             assert "tracks" not in res.unloaded
 
+    @staticmethod
+    def test_selectin_embeds(db_session):
+        """Test that a selectin embed avoids joins."""
+        query_builder = ModelResourceQueryBuilder()
+        query = db_session.query(Album)
+        query = query_builder.build(
+            query=query,
+            resource=AlbumResource(session=db_session),
+            filters=None,
+            subfilters=None,
+            embeds=["artist"],
+            embed_strategy="selectin"
+        )
+        assert "JOIN" not in str(query)
+        albums = query.all()
+        for album in albums:
+            res = inspect(album)
+            assert "artist" not in res.unloaded
+
+    @staticmethod
+    def test_selectin_embeds_required_filters(db_session):
+        """Test selectin embeds fall back for required filters."""
+        query_builder = ModelResourceQueryBuilder()
+        query = db_session.query(Album)
+        query = query_builder.build(
+            query=query,
+            resource=AlbumResource(
+                session=db_session, context={"user": "limited"}),
+            filters=None,
+            subfilters=None,
+            embeds=["artist", "tracks"],
+            embed_strategy="selectin"
+        )
+        assert "JOIN" in str(query)
+        albums = query.all()
+        for album in albums:
+            res = inspect(album)
+            assert "tracks" not in res.unloaded
+            for track in album.tracks:
+                assert track.track_id != 130
+
+    @staticmethod
+    def test_subfilter_required_filters_applied_once(db_session):
+        """Test subresource required filters aren't duplicated."""
+        query_builder = ModelResourceQueryBuilder()
+        query = db_session.query(Album)
+        query = query_builder.build(
+            query=query,
+            resource=AlbumResource(
+                session=db_session, context={"user": "limited"}),
+            filters=None,
+            subfilters={"tracks": SubfilterInfo(
+                filters={"track_id": {"$lt": 140}})},
+            dialect_override=False
+        )
+        assert str(query).count("!=") == 1
+        albums = query.all()
+        for album in albums:
+            for track in album.tracks:
+                assert track.track_id != 130
+                assert track.track_id < 140
+
     @staticmethod
     def test_property_embeds(db_session):
         """Test that property embed works."""
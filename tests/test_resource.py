@@ -18,11 +18,14 @@ from drowsy.parser import SubfilterInfo, SortInfo
 from drowsy.resource import ResourceCollection, PaginationInfo
 from drowsy.schema import NestedOpts
 from tests.base import DrowsyDatabaseTests
-from tests.models import Album, Artist, Playlist, Track
+from tests.models import Album, Artist, MediaType, Playlist, Track
 from tests.resources import (
-    AlbumResource, AlbumCamelResource, ArtistResource, CompositeNodeResource,
-    CompositeOneResource, CustomerResource, EmployeeResource, InvoiceResource,
-    InvoiceCamelResource, PlaylistResource, TrackResource)
+    AlbumResource, AlbumCamelResource, AlbumIdAliasResource,
+    AlbumSelectinResource, ArtistResource, CompositeNodeResource,
+    CompositeOneResource, CustomerResource, EmployeeResource,
+    InvoiceResource, InvoiceCamelResource, MediaTypeBulkResource,
+    MediaTypeResource, PlaylistResource, TrackResource, TrackStreamResource,
+    TrackWindowCountResource)
 from pytest import raises
 from unittest.mock import MagicMock
 from sqlalchemy.orm.session import Session
@@ -231,6 +234,20 @@ def test_pagination_info_page_size_non_int():
         )
 
 
+def test_pagination_info_set_after_init():
+    """Test PaginationInfo validates values set after creation."""
+    info = ResourceCollection([], resources_available=100)
+    info.page_size = 10
+    info.current_page = 2
+    assert "page_size" in info.__dict__
+    assert info.next_page == 3
+    with raises(ValueError):
+        info.page_size = 0
+    with raises(TypeError):
+        info.current_page = "1"
+    assert info.page_size == 10 and info.current_page == 2
+
+
 def test_pagination_info_first_page():
     """Test PaginationInfo first_page works."""
     info = PaginationInfo(
@@ -261,6 +278,19 @@ def test_pagination_info_last_page():
     assert info.last_page == 10
 
 
+def test_pagination_info_last_page_partial():
+    """Test PaginationInfo last_page rounds up a partial page."""
+    info = PaginationInfo(
+        resources_available=101,
+        page_size=10,
+        current_page=10
+    )
+    assert info.last_page == 11
+    assert info.next_page == 11
+    info.resources_available = 0
+    assert info.last_page == 0
+
+
 def test_pagination_info_last_page_none():
     """Test PaginationInfo last_page as None works."""
     info = PaginationInfo(
@@ -367,6 +397,16 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         # TODO - Research this
         assert resource.session is not None
 
+    @staticmethod
+    def test_resource_context_setter_callable(db_session):
+        """Test switching between callable and dict contexts."""
+        resource = EmployeeResource(session=db_session)
+        assert resource.context == {}
+        resource.context = lambda: {"test": "callable"}
+        assert resource.context == {"test": "callable"}
+        resource.context = {"test": "dict"}
+        assert resource.context == {"test": "dict"}
+
     @staticmethod
     def test_resource_context_callable(db_session):
         """Test that providing a callable context works."""
@@ -551,6 +591,235 @@ class TestDrowsyResource(DrowsyDatabaseTests):
             resource.make_schema(embeds=["album"])
         assert excinf.value.code == "invalid_embed"
 
+    @staticmethod
+    def test_resource_ident_filters_composite(db_session):
+        """Test ident filters for a composite key resource."""
+        resource = CompositeNodeResource(session=db_session)
+        assert resource._get_ident_filters([1, 2]) == {
+            "node_id": 1, "composite_id": 2}
+        assert resource._get_ident_filters((3, 4)) == {
+            "node_id": 3, "composite_id": 4}
+
+    @staticmethod
+    def test_resource_id_filter_names_class_cache(db_session):
+        """Test id filter names are shared by instances of a class."""
+        resource = AlbumCamelResource(session=db_session)
+        resource.make_schema(fields=["title"])
+        assert resource._get_ident_filters(1) == {"albumId": 1}
+        assert AlbumCamelResource.__dict__[
+            "_class_id_filter_names"] == ("albumId", )
+        other = AlbumCamelResource(session=db_session)
+        other._get_lookup_schema = MagicMock(side_effect=AssertionError)
+        assert other._get_ident_filters(2) == {"albumId": 2}
+
+    @staticmethod
+    def test_resource_get_context_change(db_session):
+        """Test lookups apply required filters for the current context."""
+        context = {}
+        resource = TrackResource(session=db_session, context=lambda: context)
+        track = resource._get_instance(130)
+        assert track is not None
+        assert resource.get(130)["track_id"] == 130
+        context["user"] = "limited"
+        assert resource._get_instance(130) is None
+        with raises(ResourceNotFoundError):
+            resource.get(130)
+        resource = TrackResource(session=db_session)
+        assert resource.get(130)["track_id"] == 130
+        resource.context = {"user": "limited"}
+        with raises(ResourceNotFoundError):
+            resource.get(130)
+
+    @staticmethod
+    def test_resource_get_collection_embed_multi_sort(db_session):
+        """Test every sort is applied when embeds are paginated."""
+        resource = TrackResource(session=db_session)
+        result = resource.get_collection(
+            embeds=["playlists"],
+            sorts=[SortInfo(attr="unit_price", direction="DESC"),
+                   SortInfo(attr="track_id")],
+            limit=5)
+        expected = db_session.query(Track).order_by(
+            Track.unit_price.desc(), Track.track_id.asc()).limit(5).all()
+        assert [track["track_id"] for track in result] == [
+            track.track_id for track in expected]
+
+    @staticmethod
+    def test_resource_get_collection_stream(db_session):
+        """Test streamed collection results match loaded results."""
+        resource = TrackStreamResource(session=db_session)
+        result = resource.get_collection(
+            sorts=[SortInfo(attr="track_id")], limit=250)
+        expected = TrackResource(session=db_session).get_collection(
+            sorts=[SortInfo(attr="track_id")], limit=250)
+        assert len(result) == 250
+        assert result == expected
+        assert result.resources_available == expected.resources_available
+
+    @staticmethod
+    def test_get_collection_window_count(db_session):
+        """Test the total count can come from the page query."""
+        resource = TrackWindowCountResource(session=db_session)
+        expected = TrackResource(session=db_session)
+        for offset in (0, 100, 5000):
+            result = resource.get_collection(
+                sorts=[SortInfo(attr="track_id")], limit=50, offset=offset)
+            other = expected.get_collection(
+                sorts=[SortInfo(attr="track_id")], limit=50, offset=offset)
+            assert result == other
+            assert result.resources_available == other.resources_available
+        result = resource.get_collection(filters={"track_id": -1})
+        assert result == []
+        assert result.resources_available == 0
+
+    @staticmethod
+    def test_resource_key_name_converter(db_session):
+        """Test converted key names are cached until context changes."""
+        resource = AlbumCamelResource(session=db_session)
+        resource.convert_key_name = MagicMock(
+            wraps=resource.convert_key_name)
+        converter = resource.get_key_name_converter()
+        assert converter("albumId") == "album_id"
+        assert resource.get_key_name_converter()("albumId") == "album_id"
+        assert resource.convert_key_name.call_count == 1
+        resource.context = {}
+        assert resource.get_key_name_converter()("albumId") == "album_id"
+        assert resource.convert_key_name.call_count == 2
+
+    @staticmethod
+    def test_resource_key_name_converter_override(db_session):
+        """Test an overridden convert_key_name is used by queries."""
+        resource = AlbumIdAliasResource(session=db_session)
+        result = resource.get_collection(filters={"id": 1})
+        assert len(result) == 1
+        assert result[0]["album_id"] == 1
+        result = resource.get_collection(
+            sorts=[SortInfo(attr="id", direction="DESC")])
+        assert len(result) == 347
+        assert result[0]["album_id"] == 347
+
+    @staticmethod
+    def test_resource_lookup_schema_reused(db_session):
+        """Test field lookups reuse a schema until context changes."""
+        resource = AlbumCamelResource(session=db_session)
+        schema = resource._get_lookup_schema()
+        assert resource.whitelist("album_id")
+        assert resource.convert_key_name("albumId") == "album_id"
+        assert resource._get_lookup_schema() is schema
+        resource.context = {}
+        assert resource._get_lookup_schema() is not schema
+
+    @staticmethod
+    def test_resource_get_embeds_single_make_schema(db_session):
+        """Test building embed loads doesn't rebuild the schema."""
+        resource = AlbumResource(session=db_session)
+        resource.make_schema = MagicMock(wraps=resource.make_schema)
+        result = resource.get(1, embeds=["tracks", "artist"])
+        assert len(result["tracks"]) > 0
+        assert resource.make_schema.call_count == 1
+
+    @staticmethod
+    def test_resource_make_subresource_no_schema(db_session):
+        """Test make_subresource doesn't build the resource schema."""
+        resource = AlbumResource(session=db_session)
+        resource.make_schema = MagicMock(wraps=resource.make_schema)
+        subresource = resource.make_subresource("tracks")
+        assert subresource.model is Track
+        assert resource.make_subresource("tracks") is subresource
+        assert resource.make_schema.call_count == 0
+
+    @staticmethod
+    def test_resource_class_error_messages(db_session):
+        """Test default error messages are merged once per class."""
+        merged = AlbumResource.__dict__["_merged_default_error_messages"]
+        assert "filters_too_complex" in merged
+        assert "validation_failure" in merged
+        resource = AlbumResource(
+            session=db_session,
+            error_messages={"validation_failure": "Override."})
+        assert resource.error_messages["validation_failure"] == "Override."
+        assert merged["validation_failure"] == "Unable to process entity."
+        assert resource.error_messages.maps[-1] is merged
+
+    @staticmethod
+    def test_resource_whitelist_cached(db_session):
+        """Test whitelist results are cached until context changes."""
+        resource = AlbumResource(session=db_session)
+        resource._check_whitelist = MagicMock(
+            wraps=resource._check_whitelist)
+        assert resource.whitelist("tracks.track_id")
+        assert resource.whitelist("tracks.track_id")
+        assert resource._check_whitelist.call_count == 1
+        resource.context = {}
+        assert resource.whitelist("tracks.track_id")
+        assert resource._check_whitelist.call_count == 2
+
+    @staticmethod
+    def test_resource_context_update_resets_lookups(db_session):
+        """Test updating the context in place resets cached lookups."""
+        resource = AlbumCamelResource(session=db_session)
+        resource._check_whitelist = MagicMock(
+            wraps=resource._check_whitelist)
+        resource.convert_key_name = MagicMock(
+            wraps=resource.convert_key_name)
+        assert resource.whitelist("album_id")
+        assert resource.get_key_name_converter()("albumId") == "album_id"
+        schema = resource._get_lookup_schema()
+        resource.context["user"] = "test"
+        assert resource._get_lookup_schema() is not schema
+        assert resource.whitelist("album_id")
+        assert resource.get_key_name_converter()("albumId") == "album_id"
+        assert resource._check_whitelist.call_count == 2
+        assert resource.convert_key_name.call_count == 2
+        schema = resource._get_lookup_schema()
+        assert resource.whitelist("album_id")
+        assert resource._get_lookup_schema() is schema
+        assert resource._check_whitelist.call_count == 2
+
+    @staticmethod
+    def test_resource_session_change_resets_lookups(db_session):
+        """Test replacing the session resets cached lookups."""
+        resource = AlbumResource(session=db_session)
+        assert resource.whitelist("tracks.track_id")
+        assert resource.make_subresource("tracks").session is db_session
+        schema = resource._get_lookup_schema()
+        assert not schema.fields["tracks"].embedded
+        other = Session(bind=db_session.bind)
+        resource.session = other
+        assert resource._get_lookup_schema() is not schema
+        assert resource.make_subresource("tracks").session is other
+        other.close()
+
+    @staticmethod
+    def test_make_subresource_callable_session(db_session):
+        """Test subresources use the current callable session."""
+        sessions = [db_session]
+        resource = AlbumResource(session=lambda: sessions[-1])
+        assert resource.make_subresource("tracks").session is db_session
+        other = Session(bind=db_session.bind)
+        sessions.append(other)
+        assert resource.make_subresource("tracks").session is other
+        result = resource.get_collection(
+            embeds=["tracks"], filters={"album_id": 1})
+        assert result[0]["tracks"]
+        other.close()
+
+    @staticmethod
+    def test_resource_query_builder_reused(db_session):
+        """Test the model and query builder are resolved only once."""
+        resource = AlbumResource(session=db_session)
+        assert resource.model is Album
+        assert resource.query_builder is resource.query_builder
+
+    @staticmethod
+    def test_resource_embed_history(db_session):
+        """Test only the deepest embedded paths are reported."""
+        resource = AlbumResource(session=db_session)
+        schema = resource.make_schema(
+            embeds=["tracks.playlists", "tracks", "artist"])
+        assert resource._get_embed_history(schema) == {
+            "tracks.playlists", "artist"}
+
     @staticmethod
     def test_resource_check_method_allowed(db_session):
         """Test a disallowed method fails."""
@@ -561,8 +830,31 @@ class TestDrowsyResource(DrowsyDatabaseTests):
                 head=True)
         assert excinf.value.code == "method_not_allowed"
 
+    @staticmethod
+    def test_resource_check_method_allowed_case(db_session):
+        """Test method checks ignore case and always allow OPTIONS."""
+        resource = InvoiceResource(session=db_session)
+        assert resource.opts.allowed_methods == frozenset(
+            ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
+        assert resource._check_method_allowed("get")
+        assert resource._check_method_allowed("options")
+        with raises(MethodNotAllowedError) as excinf:
+            resource._check_method_allowed("head")
+        assert excinf.value.kwargs["method"] == "HEAD"
+
+    @staticmethod
+    def test_resource_check_method_allowed_options_override(db_session):
+        """Test an overridden options property limits allowed methods."""
+        class ReadOnlyInvoiceResource(InvoiceResource):
+            @property
+            def options(self):
+                return ["GET"]
 
-    # PATCH TESTS
+        resource = ReadOnlyInvoiceResource(session=db_session)
+        assert resource._check_method_allowed("GET")
+        assert resource._check_method_allowed("OPTIONS")
+        with raises(MethodNotAllowedError):
+            resource._check_method_allowed("PATCH")
 
     @staticmethod
     def test_patch_simple(db_session):
@@ -574,6 +866,23 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         assert result["title"] == "TEST"
         assert album.title == "TEST"
 
+    @staticmethod
+    def test_patch_no_body(db_session):
+        """Test a patch can skip returning the updated resource."""
+        album_resource = AlbumResource(session=db_session)
+        result = album_resource.patch(1, {"title": "TEST"}, return_body=False)
+        assert result is None
+        album = db_session.query(Album).filter(Album.album_id == 1).first()
+        assert album.title == "TEST"
+
+    @staticmethod
+    def test_patch_resource_not_found(db_session):
+        """Test patching a non existent resource fails."""
+        album_resource = AlbumResource(session=db_session)
+        with raises(ResourceNotFoundError) as excinf:
+            album_resource.patch(9999999, {"title": "TEST"})
+        assert excinf.value.code == "resource_not_found"
+
     @staticmethod
     def test_patch_no_tuple_ident(db_session):
         """Test passing a single value identity works."""
@@ -896,6 +1205,48 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         assert len(result) == 1
         assert result[0]["album_id"] == 5
 
+    @staticmethod
+    def test_get_collection_empty_in_filters(db_session):
+        """Test an empty $in filter returns no results."""
+        filters = {
+            "$and": [
+                {"title": {"$like": "Big"}},
+                {"album_id": {"$in": []}}
+            ]
+        }
+        album_resource = AlbumResource(session=db_session)
+        result = album_resource.get_collection(filters=filters)
+        assert len(result) == 0
+        assert result.resources_available == 0
+
+    @staticmethod
+    def test_get_collection_empty_in_filters_invalid_op(db_session):
+        """Test an empty $in filter still validates other filters."""
+        filters = {"album_id": {"$in": []}, "title": {"$bad": "Big"}}
+        album_resource = AlbumResource(session=db_session)
+        with raises(BadRequestError) as excinf:
+            album_resource.get_collection(filters=filters)
+        assert excinf.value.code == "filters_field_op_error"
+
+    @staticmethod
+    def test_get_collection_limit_zero(db_session):
+        """Test a limit of zero still gets the available count."""
+        album_resource = AlbumResource(session=db_session)
+        result = album_resource.get_collection(limit=0)
+        assert len(result) == 0
+        assert result.resources_available == 347
+
+    @staticmethod
+    def test_get_collection_selectin_embeds(db_session):
+        """Test get_collection with a selectin embed load strategy."""
+        album_resource = AlbumSelectinResource(session=db_session)
+        result = album_resource.get_collection(
+            embeds=["artist", "tracks.track_id"],
+            limit=2)
+        assert len(result) == 2
+        assert result[0]["artist"]["artist_id"] == 1
+        assert result[0]["tracks"][0]["track_id"] == 1
+
     @staticmethod
     def test_get_collection_invalid_filters(db_session):
         """Test simple get_collection filtering failure."""
@@ -931,6 +1282,16 @@ class TestDrowsyResource(DrowsyDatabaseTests):
             album_resource.get_collection(sorts=[SortInfo(attr="TEST")])
         assert excinf.value.code == "invalid_sort_field"
 
+    @staticmethod
+    def test_get_collection_invalid_sort_field_ignore(db_session):
+        """Test a bad sort is skipped while other sorts still apply."""
+        album_resource = AlbumResource(session=db_session)
+        result = album_resource.get_collection(
+            sorts=[SortInfo(attr="TEST"),
+                   SortInfo(attr="album_id", direction="DESC")],
+            strict=False)
+        assert result[0]["album_id"] == 347
+
     @staticmethod
     def test_get_collection_subresource_query(db_session):
         """Test a subresource query."""
@@ -1040,6 +1401,24 @@ class TestDrowsyResource(DrowsyDatabaseTests):
             context={"user": "limited_single_filter"})
         assert resource.get_required_nested_filters("albums.tracks") is not None
 
+    @staticmethod
+    def test_apply_required_filters_not_overridden(db_session):
+        """Resources without required filters return the query as is."""
+        resource = AlbumResource(session=db_session)
+        query = db_session.query(Album)
+        assert resource.apply_required_filters(query) is query
+
+    @staticmethod
+    def test_get_required_nested_filters_lookup_schema(db_session):
+        """Nested filter lookups reuse the lookup schema unmodified."""
+        resource = ArtistResource(
+            session=db_session,
+            context={"user": "limited_single_filter"})
+        schema = resource._get_lookup_schema()
+        assert resource.get_required_nested_filters("albums.tracks") is not None
+        assert resource._get_lookup_schema() is schema
+        assert not schema.fields["albums"].embedded
+
     # POST TESTS
 
     @staticmethod
@@ -1169,6 +1548,41 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         )
         assert result2 is not None
 
+    @staticmethod
+    def test_post_collection_single_schema(db_session):
+        """Test posting multiple objects only builds one schema."""
+        data = [
+            {"album_id": 9998, "title": "test1", "artist": {"artist_id": 1}},
+            {"album_id": 9999, "title": "test2", "artist": {"artist_id": 2}}
+        ]
+        resource = AlbumResource(session=db_session)
+        resource.make_schema = MagicMock(wraps=resource.make_schema)
+        resource.post_collection(data)
+        assert resource.make_schema.call_count == 1
+        result1 = db_session.query(Album).filter(
+            Album.album_id == 9998).first()
+        result2 = db_session.query(Album).filter(
+            Album.album_id == 9999).first()
+        assert result1.title == "test1" and result1.artist_id == 1
+        assert result2.title == "test2" and result2.artist_id == 2
+
+    @staticmethod
+    def test_post_collection_bulk_insert(db_session):
+        """Test posting multiple objects using a bulk insert."""
+        data = [
+            {"media_type_id": 9998, "name": "test1"},
+            {"media_type_id": 9999, "name": "test2"}
+        ]
+        resource = MediaTypeBulkResource(session=db_session)
+        db_session.bulk_save_objects = MagicMock(
+            wraps=db_session.bulk_save_objects)
+        resource.post_collection(data)
+        assert db_session.bulk_save_objects.call_count == 1
+        assert len(db_session.bulk_save_objects.call_args[0][0]) == 2
+        results = db_session.query(MediaType).filter(
+            MediaType.media_type_id.in_([9998, 9999])).all()
+        assert sorted(r.name for r in results) == ["test1", "test2"]
+
     @staticmethod
     def test_post_collection_bad_input(db_session):
         """Test posting a non list to a collection fails."""
@@ -1446,6 +1860,48 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         ).first()
         assert result is None
 
+    @staticmethod
+    def test_delete_no_make_schema(db_session):
+        """Test deleting a resource never calls make_schema."""
+        resource = AlbumResource(session=db_session)
+        resource.make_schema = MagicMock(side_effect=AssertionError)
+        resource.delete(1)
+        result = db_session.query(Album).filter(
+            Album.album_id == 1
+        ).first()
+        assert result is None
+        resource = MediaTypeResource(session=db_session)
+        resource.make_schema = MagicMock(side_effect=AssertionError)
+        resource.delete(5)
+        assert not resource.make_schema.called
+
+    @staticmethod
+    def test_delete_directly(db_session):
+        """Test deleting a resource without loading it first."""
+        resource = MediaTypeResource(session=db_session)
+        assert resource._can_delete_directly()
+        db_session.query = MagicMock(wraps=db_session.query)
+        resource.delete(5)
+        assert db_session.query.call_count == 1
+        result = db_session.query(MediaType).filter(
+            MediaType.media_type_id == 5
+        ).first()
+        assert result is None
+
+    @staticmethod
+    def test_delete_directly_not_found(db_session):
+        """Test directly deleting a non existent resource fails."""
+        resource = MediaTypeResource(session=db_session)
+        with raises(ResourceNotFoundError) as excinf:
+            resource.delete(9999999)
+        assert excinf.value.code == "resource_not_found"
+
+    @staticmethod
+    def test_delete_not_directly(db_session):
+        """Test resources with relationships aren't deleted directly."""
+        resource = AlbumResource(session=db_session)
+        assert not resource._can_delete_directly()
+
     @staticmethod
     def test_delete_resource_not_found(db_session):
         """Test deleting a non existent resource fails."""
@@ -1476,6 +1932,52 @@ class TestDrowsyResource(DrowsyDatabaseTests):
         assert len(playlists) == 0
         assert result is None
 
+    @staticmethod
+    def test_delete_collection_directly(db_session):
+        """Test deleting from a collection without loading it first."""
+        resource = MediaTypeResource(session=db_session)
+        db_session.commit = MagicMock(wraps=db_session.commit)
+        resource.delete_collection(filters={"media_type_id": 9999999})
+        assert db_session.commit.call_count == 0
+        resource.delete_collection(
+            filters={"media_type_id": {"$in": [4, 5]}})
+        assert db_session.commit.call_count == 1
+        result = db_session.query(MediaType).filter(
+            MediaType.media_type_id.in_([4, 5])).all()
+        assert result == []
+
+    @staticmethod
+    def test_delete_collection_joined_query(db_session):
+        """Test a joined query falls back to deleting each instance."""
+        resource = MediaTypeResource(session=db_session)
+        query = db_session.query(MediaType).join(
+            Track, Track.media_type_id == MediaType.media_type_id).filter(
+            Track.track_id == 1)
+        media_type_id = query.one().media_type_id
+        resource._bulk_delete = MagicMock(side_effect=AssertionError)
+        resource.delete_collection(session=query)
+        assert not resource._bulk_delete.called
+        result = db_session.query(MediaType).filter(
+            MediaType.media_type_id == media_type_id).all()
+        assert result == []
+
+    @staticmethod
+    def test_delete_collection_directly_syncs_session(db_session):
+        """Test loaded instances of directly deleted rows are removed."""
+        resource = MediaTypeResource(session=db_session)
+        loaded = db_session.query(MediaType).filter(
+            MediaType.media_type_id.in_([4, 5])).all()
+        assert len(loaded) == 2
+        resource.delete_collection(
+            filters={"media_type_id": {"$in": [4, 5]}})
+        assert not any(instance in db_session for instance in loaded)
+        loaded = db_session.query(MediaType).filter(
+            MediaType.name.like("%MPEG%")).all()
+        assert loaded
+        # $like can't be evaluated in Python, so rows are fetched.
+        resource.delete_collection(filters={"name": {"$like": "%MPEG%"}})
+        assert not any(instance in db_session for instance in loaded)
+
     @staticmethod
     def test_delete_collection_permission_denied(db_session):
         """Test delete collection permission denied errors."""
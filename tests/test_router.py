@@ -106,6 +106,33 @@ class TestDrowsyRouter(DrowsyDatabaseTests):
         )
         assert result["track_id"] == 4000
 
+    @staticmethod
+    def test_router_dispatch_patch_no_body(db_session):
+        """Test dispatching a patch without returning the body."""
+        router = ModelResourceRouter(session=db_session)
+        result = router.dispatcher(
+            method="patch",
+            path="/albums/1",
+            data={"title": "TEST"},
+            return_body=False)
+        assert result is None
+        album = db_session.query(Album).filter(Album.album_id == 1).first()
+        assert album.title == "TEST"
+
+    @staticmethod
+    def test_router_dispatch_patch_legacy_signature(db_session):
+        """Test dispatching to a patch override without return_body."""
+        class LegacyRouter(ModelResourceRouter):
+            def patch(self, path, data):
+                return super(LegacyRouter, self).patch(path, data)
+
+        router = LegacyRouter(session=db_session)
+        result = router.dispatcher(
+            method="patch",
+            path="/albums/1",
+            data={"title": "TEST"})
+        assert result["title"] == "TEST"
+
     @staticmethod
     def test_router_dispatch_put(db_session):
         """Test that auto router dispatch to put works."""
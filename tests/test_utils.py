@@ -10,7 +10,8 @@
 # :license: MIT - See LICENSE for more details.
 from mqlalchemy.utils import dummy_gettext
 from .schemas import MsAlbumSchema
-from drowsy.utils import get_field_by_data_key, get_error_message
+from drowsy.utils import (
+    MemoizingDict, get_field_by_data_key, get_error_message)
 
 
 def test_get_field_by_data_key():
@@ -37,3 +38,17 @@ def test_get_error_message_no_string():
         error_messages=error_messages,
         gettext=dummy_gettext)
     assert result == 5
+
+
+def test_memoizing_dict():
+    """Test MemoizingDict only calls its function once per key."""
+    calls = []
+
+    def upper(key):
+        """Record calls and return an uppercase version of key."""
+        calls.append(key)
+        return key.upper()
+    memo = MemoizingDict(upper)
+    assert memo["test"] == "TEST"
+    assert memo["test"] == "TEST"
+    assert calls == ["test"]